@@ -4,13 +4,20 @@ WebSocket Dependencies - FastAPI dependency injection for WebSocket services.
 This module provides dependency injection functions for WebSocket services,
 enabling clean integration with FastAPI routers and proper service lifecycle management.
 """
-from typing import Optional
+import os
+from typing import Any, Optional
 
 from .websocket import EventBroadcaster, WebSocketManager
 
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
 # Global instances (would be managed by dependency injection container in production)
 _websocket_manager: Optional[WebSocketManager] = None
 _event_broadcaster: Optional[EventBroadcaster] = None
+_redis_client: Optional[Any] = None
 
 
 def get_websocket_manager() -> WebSocketManager:
@@ -46,6 +53,22 @@ def get_event_broadcaster() -> EventBroadcaster:
     return _event_broadcaster
 
 
+def get_redis_client() -> Optional[Any]:
+    """
+    Get the shared Redis client used for response caching.
+
+    Returns:
+        Optional[Redis]: Async Redis client, or None when REDIS_URL is unset
+        or the redis package is unavailable (caching is then skipped)
+    """
+    global _redis_client
+    if _redis_client is None and aioredis is not None:
+        redis_url = os.getenv("REDIS_URL")
+        if redis_url:
+            _redis_client = aioredis.from_url(redis_url)
+    return _redis_client
+
+
 # Authentication dependency (placeholder - would integrate with actual auth service)
 def get_current_user():
     """
@@ -70,6 +70,8 @@ from starlette.requests import Request
 from starlette.responses import JSONResponse
 from starlette.responses import Response as StarletteResponse
 
+from ..shared_types.engine_types import EngineError
+
 # Import WebSocket functionality
 from .websocket import websocket_endpoint, websocket_manager
 
@@ -381,6 +383,19 @@ def configure_error_handlers(app: FastAPI):
             }
         )
 
+    @app.exception_handler(EngineError)
+    async def engine_error_handler(request: Request, exc: EngineError):
+        """Handle domain errors raised by services with their own status code."""
+        return JSONResponse(
+            status_code=exc.status_code,
+            content={
+                "error": exc.detail,
+                "status_code": exc.status_code,
+                "timestamp": datetime.utcnow().isoformat(),
+                "request_id": getattr(request.state, 'request_id', None)
+            }
+        )
+
     @app.exception_handler(Exception)
     async def general_exception_handler(request: Request, exc: Exception):
         """Handle general exceptions."""
@@ -670,7 +685,10 @@ if __name__ == "__main__":
         port=8000,
         reload=True,
         log_level="info",
-        access_log=True
+        access_log=True,
+        # Broadcasts share one encoded payload; per-connection deflate would
+        # recompress it for every subscriber
+        ws_per_message_deflate=False
     )
 
 
@@ -769,5 +787,6 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=True,
-        log_level="info"
+        log_level="info",
+        ws_per_message_deflate=False
     )
@@ -210,7 +210,7 @@ async def list_agents(
     except HTTPException:
         raise
     except EngineError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception:
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -337,7 +337,7 @@ async def create_agent(
     except HTTPException:
         raise
     except EngineError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception:
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -436,7 +436,7 @@ async def update_agent(
     except HTTPException:
         raise
     except EngineError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception:
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -497,7 +497,7 @@ async def delete_agent(
     except HTTPException:
         raise
     except EngineError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception:
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -583,7 +583,7 @@ async def execute_task(
     except HTTPException:
         raise
     except EngineError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception:
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -175,7 +175,7 @@ async def get_project_logs(
     except HTTPException:
         raise
     except EngineError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception as _:  # noqa: F841
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -253,7 +253,7 @@ async def get_project_metrics(
     except HTTPException:
         raise
     except EngineError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception as _:  # noqa: F841
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -314,7 +314,7 @@ async def project_health(
     except HTTPException:
         raise
     except EngineError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception as _:  # noqa: F841
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -355,7 +355,7 @@ async def stream_project_metrics(
     except HTTPException:
         raise
     except EngineError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception as _:  # noqa: F841
         raise HTTPException(status_code=500, detail="Internal server error")
 
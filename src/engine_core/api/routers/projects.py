@@ -134,7 +134,7 @@ async def list_projects(
         )
 
     except EngineError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception as e:
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -210,7 +210,7 @@ async def create_project(
         # Re-raise HTTP exceptions
         raise
     except EngineError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception as e:
         raise HTTPException(status_code=500, detail="Internal server error")
 
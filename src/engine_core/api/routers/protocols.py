@@ -186,7 +186,7 @@ async def list_protocols(
     except HTTPException:
         raise
     except EngineError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception as e:
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -262,7 +262,7 @@ async def create_protocol(
     except HTTPException:
         raise
     except EngineError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception as e:
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -326,7 +326,7 @@ async def update_protocol(
     except HTTPException:
         raise
     except EngineError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception as e:
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -378,7 +378,7 @@ async def delete_protocol(
     except HTTPException:
         raise
     except EngineError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception as e:
         raise HTTPException(status_code=500, detail="Internal server error")
 
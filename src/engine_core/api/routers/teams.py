@@ -164,7 +164,7 @@ async def list_teams(project_id: str,
     except HTTPException:
         raise
     except EngineError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception as e:
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -285,7 +285,7 @@ async def create_team(
     except HTTPException:
         raise
     except EngineError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception as e:
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -402,7 +402,7 @@ async def execute_project(
     except HTTPException:
         raise
     except EngineError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception as e:
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -5,17 +5,37 @@ Handles tool integration management within projects including API, CLI, and MCP
 This router provides endpoints for managing external tool integrations that agents
 can use to interact with APIs, command-line tools, and MCP servers.
 """
+import json
+import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from enum import Enum
+from typing import Annotated, Any, AsyncIterator, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Path, Query
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
 
 from engine_core.api.dependencies import get_current_user
 from engine_core.api.websocket import EventType, get_event_broadcaster
 from engine_core.core.project_service import ProjectService
-from engine_core.services.tool_service import ToolService
-from engine_core.shared_types.engine_types import EngineError, ToolType
+from engine_core.services.tool_service import (
+    ToolCreateRequest,
+    ToolNotFoundError,
+    ToolSearchCriteria,
+    ToolService,
+    ToolServiceError,
+    ToolStatus,
+    ToolSummaryRow,
+    ToolType,
+)
+
+logger = logging.getLogger(__name__)
+
+# Optional fast JSON encoder for streamed list payloads
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
 
 
 class ToolAuthentication(BaseModel):
@@ -29,6 +49,11 @@ class ToolAuthentication(BaseModel):
     password: Optional[str] = Field(None, description="Password for basic auth")
     headers: Optional[Dict[str, str]] = Field(None, description="Additional headers")
 
+    class Config:
+        """Pydantic configuration."""
+
+        frozen = True
+
 
 class ToolConfig(BaseModel):
     """Tool interface configuration"""
@@ -116,6 +141,147 @@ class ToolListResponse(BaseModel):
 
     tools: List[ToolSummary]
     total: int
+    next_cursor: Optional[str] = None
+
+
+_MASKED = "***masked***"
+
+# API tool type names mapped to service tool types
+_TOOL_TYPES: Dict[str, ToolType] = {
+    "api": ToolType.API,
+    "cli": ToolType.CLI,
+    "mcp": ToolType.MCP,
+    "mcp_server": ToolType.MCP,
+}
+
+
+def _mask_auth(auth: Optional[ToolAuthentication]) -> Optional[Dict[str, Any]]:
+    """Return the authentication config with secrets masked, leaving auth as is."""
+    if auth is None:
+        return None
+    return auth.model_dump(exclude={"token", "password"}) | {
+        "token": _MASKED if auth.token else None,
+        "password": _MASKED if auth.password else None,
+    }
+
+
+def _to_create_request(
+    tool_data: ToolCreate, project_id: str, user_id: str
+) -> ToolCreateRequest:
+    """Translate an API tool definition into a service create request."""
+    tool_type = _TOOL_TYPES.get(tool_data.tool_type)
+    if tool_type is None:
+        raise HTTPException(
+            status_code=400, detail=f"Unsupported tool type: {tool_data.tool_type}"
+        )
+
+    config = tool_data.interface_config
+    parameters = config.parameters or {}
+    auth = tool_data.authentication
+    return ToolCreateRequest(
+        tool_id=tool_data.id,
+        name=tool_data.name,
+        tool_type=tool_type,
+        description=tool_data.description or "",
+        endpoint=config.base_url,
+        authentication=auth.model_dump(exclude={"headers"}) if auth else {},
+        headers=(auth.headers if auth else None) or {},
+        timeout_seconds=config.timeout_seconds,
+        retry_attempts=config.retries,
+        capabilities=[{"name": name} for name in tool_data.available_commands],
+        metadata={"parameters": parameters, "rate_limits": tool_data.rate_limits},
+        mcp_server_path=parameters.get("server_path"),
+        mcp_args=list(parameters.get("args", [])),
+        project_id=project_id,
+        user_id=user_id,
+    )
+
+
+def _json_default(value: Any) -> Any:
+    """Encode values the stdlib JSON encoder does not handle natively."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dumps(value: Any) -> bytes:
+    """Serialize a value to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, default=_json_default, separators=(",", ":")).encode()
+
+
+async def _stream_tool_list(
+    first: ToolSummaryRow,
+    rows: AsyncIterator[ToolSummaryRow],
+    total: int,
+    limit: int,
+) -> AsyncIterator[bytes]:
+    """Stream a ToolListResponse body one summary row at a time.
+
+    ``first`` is fetched by the caller before the response starts, so a
+    failing query still becomes an error status instead of a truncated body.
+    """
+    yield b'{"tools":[' + _dumps(first._asdict())
+    sent = 1
+    last_id = first.id
+    try:
+        async for row in rows:
+            yield b"," + _dumps(row._asdict())
+            sent += 1
+            last_id = row.id
+    except Exception as e:
+        # The status line is already sent; abort rather than close the JSON
+        logger.error(f"Tool list stream failed after {sent} rows: {str(e)}")
+        raise
+
+    # A full page means there may be more rows after the last one sent
+    next_cursor = last_id if sent == limit else None
+    yield b'],"total":%d,"next_cursor":%s}' % (total, _dumps(next_cursor))
+
+
+async def _finalize_tool_status(
+    tool_service: ToolService,
+    event_broadcaster: Any,
+    project_id: str,
+    tool_id: str,
+    user_id: str,
+) -> None:
+    """
+    Test a new tool's connection and broadcast its final status.
+
+    Runs as a background task, so every failure is logged here and a
+    terminal status is always broadcast.
+    """
+    try:
+        status = await tool_service.test_and_finalize_status(tool_id)
+    except Exception as e:
+        logger.error(f"Finalizing status for tool {tool_id} failed: {str(e)}")
+        status = ToolStatus.ERROR
+
+    try:
+        await event_broadcaster.broadcast_event(
+            event_type=EventType.TOOL_STATUS_CHANGED,
+            data={
+                "project_id": project_id,
+                "tool_id": tool_id,
+                "status": status.value,
+                "action": "connection_tested",
+            },
+            target_user_id=user_id,
+        )
+    except Exception as e:
+        logger.error(f"Failed to broadcast status for tool {tool_id}: {str(e)}")
+
+
+# Shared dependency declarations for route signatures
+CurrentUser = Annotated[dict, Depends(get_current_user)]
+ToolSvc = Annotated[ToolService, Depends()]
+ProjectSvc = Annotated[ProjectService, Depends()]
+Broadcaster = Annotated[Any, Depends(get_event_broadcaster)]
+ProjectId = Annotated[str, Path(description="Project ID")]
 
 
 # Create router instance
@@ -131,130 +297,149 @@ router = APIRouter(
 )
 
 
-@router.get("/", response_model=ToolListResponse)
+@router.get(
+    "/",
+    response_model=None,
+    responses={200: {"model": ToolListResponse}},
+)
 async def list_tools(
-    project_id: str = Path(..., description="Project ID"),
+    project_id: ProjectId,
+    current_user: CurrentUser,
+    tool_service: ToolSvc,
+    project_service: ProjectSvc,
     tool_type: Optional[str] = Query(None, description="Filter by tool type"),
     status: Optional[str] = Query(None, description="Filter by tool status"),
-    current_user: dict = Depends(get_current_user),
-    tool_service: ToolService = Depends(),
-    project_service: ProjectService = Depends(),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum tools to return"),
+    cursor: Optional[str] = Query(
+        None, description="Return tools after this tool ID (from next_cursor)"
+    ),
 ):
-    """List all tools in a project."""
+    """
+    List all tools in a project.
+
+    The response is streamed row by row so large projects do not build the
+    whole tool list in memory, so it is not validated against
+    ToolListResponse. `total` counts every matching tool, not just this
+    page; use `next_cursor` as `cursor` to fetch the next page.
+    """
+    # Verify project exists and user has access
+    project = await project_service.get_project(project_id, current_user["id"])
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    # Get tools for the project, filtered by the repository query
     try:
-        # Verify project exists and user has access
-        project = await project_service.get_project(project_id, current_user["id"])
-        if not project:
-            raise HTTPException(status_code=404, detail="Project not found")
-
-        # Get tools for the project
-        from engine_core.services.tool_service import ToolSearchCriteria
-
-        criteria = ToolSearchCriteria()
-        tools_data = await tool_service.search_tools(criteria)
-
-        # Convert to response format
-        tools = []
-        for tool in tools_data:
-            tools.append(
-                ToolSummary(
-                    id=str(tool.id),
-                    name=getattr(tool, "name", "Unknown"),
-                    description=getattr(tool, "description", None),
-                    tool_type=getattr(tool, "tool_type", "unknown"),
-                    status=getattr(tool, "status", "unknown"),
-                    created_at=getattr(tool, "created_at", datetime.utcnow()),
-                    command_count=0,
-                )
-            )
-
-        return ToolListResponse(tools=tools, total=len(tools))
-
-    except HTTPException:
-        raise
-    except EngineError as e:
+        criteria = ToolSearchCriteria(
+            project_id=project_id,
+            tool_type=ToolType(tool_type) if tool_type else None,
+            status=ToolStatus(status) if status else None,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="Internal server error")
 
+    # Run the queries before the response starts so failures map to a status
+    rows = tool_service.iter_summaries(criteria)
+    try:
+        total = await tool_service.count_tools(criteria)
+        first = await anext(rows, None)
+    except ToolServiceError:
+        raise HTTPException(status_code=500, detail="Failed to list tools")
+
+    if first is None:
+        return ToolListResponse(tools=[], total=total)
 
-@router.post("/", response_model=ToolResponse)
+    return StreamingResponse(
+        _stream_tool_list(first, rows, total, limit),
+        media_type="application/json",
+    )
+
+
+@router.post(
+    "/",
+    response_model=None,
+    responses={200: {"model": ToolResponse}},
+)
 async def create_tool(
     tool_data: ToolCreate,
-    project_id: str = Path(..., description="Project ID"),
-    current_user: dict = Depends(get_current_user),
-    tool_service: ToolService = Depends(),
-    project_service: ProjectService = Depends(),
-    event_broadcaster=Depends(get_event_broadcaster),
+    background_tasks: BackgroundTasks,
+    project_id: ProjectId,
+    current_user: CurrentUser,
+    tool_service: ToolSvc,
+    project_service: ProjectSvc,
+    event_broadcaster: Broadcaster,
 ):
-    """Create a new tool integration in a project."""
+    """
+    Create a new tool integration in a project.
+
+    The tool is returned with status "pending"; its connection is tested in
+    the background and the final status is broadcast as a
+    TOOL_STATUS_CHANGED event.
+
+    The ToolResponse is serialized directly rather than through
+    response_model, so it is validated once when built instead of twice.
+    """
+    # Verify project exists and user has access
+    project = await project_service.get_project(project_id, current_user["id"])
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    # Check if tool ID already exists
     try:
-        # Verify project exists and user has access
-        project = await project_service.get_project(project_id, current_user["id"])
-        if not project:
-            raise HTTPException(status_code=404, detail="Project not found")
-
-        # Check if tool ID already exists
-        try:
-            existing_tool = await tool_service.get_tool(tool_data.id)
-            if existing_tool:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Tool with ID '{tool_data.id}' already exists",
-                )
-        except:
-            pass  # Tool doesn't exist, which is fine
-
-        # Create the tool (mock implementation for now)
-        tool = type(
-            "MockTool",
-            (),
-            {
-                "id": tool_data.id,
-                "name": tool_data.name,
-                "description": tool_data.description,
-                "tool_type": tool_data.tool_type,
-                "created_at": datetime.utcnow(),
-                "updated_at": None,
-            },
-        )()
-
-        # Prepare response
-        response = ToolResponse(
-            id=str(getattr(tool, "id", tool_data.id)),
-            name=getattr(tool, "name", tool_data.name),
-            description=getattr(tool, "description", tool_data.description),
-            tool_type=getattr(tool, "tool_type", tool_data.tool_type),
-            interface_config=tool_data.interface_config,
-            authentication=tool_data.authentication,
-            available_commands=tool_data.available_commands,
-            rate_limits=tool_data.rate_limits,
-            status="active",
-            created_at=datetime.utcnow(),
-            updated_at=None,
-            command_count=len(tool_data.available_commands),
+        existing_tool = await tool_service.get_tool(tool_data.id)
+    except ToolNotFoundError:
+        existing_tool = None  # Tool doesn't exist, which is fine
+    if existing_tool:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Tool with ID '{tool_data.id}' already exists",
         )
 
-        # Broadcast tool creation event
-        await event_broadcaster.broadcast_event(
-            event_type=EventType.TOOL_STATUS_CHANGED,
-            data={
-                "project_id": project_id,
-                "tool_id": str(getattr(tool, "id", tool_data.id)),
-                "tool_name": tool_data.name,
-                "action": "created",
-            },
-            user_id=current_user["id"],
-        )
+    # Persist the tool as pending until its connection has been tested
+    tool = await tool_service.create_pending_tool(
+        _to_create_request(tool_data, project_id, current_user["id"])
+    )
 
-        return response
+    # Prepare response
+    response = ToolResponse(
+        id=str(getattr(tool, "id", tool_data.id)),
+        name=getattr(tool, "name", tool_data.name),
+        description=getattr(tool, "description", tool_data.description),
+        tool_type=tool_data.tool_type,
+        interface_config=tool_data.interface_config,
+        authentication=_mask_auth(tool_data.authentication),
+        available_commands=tool_data.available_commands,
+        rate_limits=tool_data.rate_limits,
+        status=ToolStatus.PENDING.value,
+        created_at=getattr(tool, "created_at", None) or datetime.utcnow(),
+        updated_at=None,
+        command_count=len(tool_data.available_commands),
+    )
 
-    except HTTPException:
-        raise
-    except EngineError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="Internal server error")
+    # Broadcast tool creation event
+    await event_broadcaster.broadcast_event(
+        event_type=EventType.TOOL_STATUS_CHANGED,
+        data={
+            "project_id": project_id,
+            "tool_id": str(getattr(tool, "id", tool_data.id)),
+            "tool_name": tool_data.name,
+            "action": "created",
+        },
+        target_user_id=current_user["id"],
+    )
+
+    # Test the connection after the response is sent
+    background_tasks.add_task(
+        _finalize_tool_status,
+        tool_service,
+        event_broadcaster,
+        project_id,
+        response.id,
+        current_user["id"],
+    )
+
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 
 # Health check endpoint for tools
@@ -5,23 +5,46 @@ Handles workflow management and execution within projects based on Pregel comput
 This router provides endpoints for managing workflows which define directed acyclic graphs
 of tasks to be executed by agents. Workflows use the Pregel model for distributed computation.
 """
-import uuid
+import asyncio
+import logging
+import secrets
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional, Set, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from fastapi import Path as FastAPIPath
 from fastapi import Query
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from pydantic import BaseModel, Field
 
 from ..core.project_service import ProjectService
-from ..dependencies import get_current_user, get_event_broadcaster
+from ..dependencies import (
+    get_current_user, get_event_broadcaster, get_redis_client)
 from ..engine_core.engine_types import EngineError, ExecutionMode, WorkflowStatus
 from ..engine_core.services.agent_service import AgentService
-from ..engine_core.services.workflow_service import WorkflowService
+from ..engine_core.services.workflow_service import (
+    WorkflowSearchCriteria, WorkflowService, WorkflowValidationError)
 from ..websocket import EventType
 
+logger = logging.getLogger(__name__)
+
+# Optional fast JSON encoder for large workflow payloads
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+# ORJSONResponse requires orjson at render time, so fall back to JSONResponse
+_WorkflowJSONResponse = ORJSONResponse if orjson is not None else JSONResponse
+
+# Literal mirrors of ExecutionMode/WorkflowStatus so request validation runs
+# in pydantic-core instead of in the handlers
+ExecutionModeName = Literal["sequential", "parallel", "hybrid"]
+WorkflowStatusName = Literal[
+    "draft", "ready", "executing", "completed", "failed", "paused"]
+
 
 class WorkflowVertex(BaseModel):
     """Workflow vertex (node) definition"""
@@ -68,8 +91,8 @@ class WorkflowCreate(BaseModel):
                     description="Unique workflow identifier")
     name: str = Field(..., min_length=1, max_length=100,
                       description="Human-readable workflow name")
-    execution_mode: str = Field(
-        "mixed", description="Execution mode (sequential, parallel, mixed)")
+    execution_mode: ExecutionModeName = Field(
+        "hybrid", description="Execution mode (sequential, parallel, hybrid)")
     vertices: List[WorkflowVertex] = Field(..., description="List of workflow vertices")
     edges: List[WorkflowEdge] = Field(
         default_factory=list,
@@ -81,7 +104,7 @@ class WorkflowCreate(BaseModel):
 class WorkflowUpdate(BaseModel):
     """Workflow update request model"""
     name: Optional[str] = Field(None, min_length=1, max_length=100)
-    execution_mode: Optional[str] = Field(None)
+    execution_mode: Optional[ExecutionModeName] = Field(None)
     vertices: Optional[List[WorkflowVertex]] = Field(None)
     edges: Optional[List[WorkflowEdge]] = Field(None)
     description: Optional[str] = Field(None, max_length=500)
@@ -129,6 +152,84 @@ class WorkflowExecutionResponse(BaseModel):
     estimated_completion: Optional[datetime] = None
 
 
+async def _broadcast_event(event_broadcaster: Any, **event: Any) -> None:
+    """Broadcast an event after the response is sent, logging any failure."""
+    try:
+        await event_broadcaster.broadcast_event(**event)
+    except Exception as e:
+        logger.error(f"Failed to broadcast {event.get('event_type')}: {str(e)}")
+
+
+# Graph fields left out of WORKFLOW_UPDATED "changes"; the event would
+# otherwise carry a full dump of every vertex and edge
+_GRAPH_FIELDS = {"vertices", "edges"}
+
+# Execution mode strings mapped to their enum members
+_EXECUTION_MODES: Dict[str, ExecutionMode] = {
+    mode.value: mode for mode in ExecutionMode}
+
+
+def _collect_agent_ids(vertices: List[WorkflowVertex]) -> Set[str]:
+    """Collect the IDs of the agents referenced by workflow vertices."""
+    return {vertex.agent_id for vertex in vertices}
+
+
+async def _validate_dag(
+        workflow_service: WorkflowService,
+        vertices: List[Any],
+        edges: List[Any]) -> None:
+    """
+    Validate dependencies, edge endpoints and acyclicity.
+
+    All checks live in ``WorkflowService.validate_dag``, which also accepts
+    the plain dict edges of a stored workflow; failures become a 400.
+    """
+    try:
+        await workflow_service.validate_dag(vertices, edges)
+    except WorkflowValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+async def _verify_agents(agent_service: AgentService, agent_ids: Set[str]) -> None:
+    """Raise 400 if any referenced agent is missing, using one bulk lookup."""
+    agents = await agent_service.get_agents_bulk(agent_ids)
+    for agent_id in agent_ids:
+        if agent_id not in agents:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Agent '{agent_id}' not found in project"
+            )
+
+
+# Cached list_workflows bodies live this long in Redis (seconds)
+WORKFLOW_LIST_CACHE_TTL = 5
+
+
+def _workflow_list_key(project_id: str, status: Optional[str],
+                       execution_mode: Optional[str],
+                       limit: int, offset: int) -> str:
+    """
+    Redis key for a serialized list_workflows page.
+
+    Built only from the parameters that shape the result; project access is
+    checked before the cache is consulted, so pages are shared across users.
+    """
+    return f"wf_list:{project_id}:{status}:{execution_mode}:{limit}:{offset}"
+
+
+async def _invalidate_workflow_lists(redis_client: Any, project_id: str) -> None:
+    """Drop every cached workflow list for a project, logging any failure."""
+    if redis_client is None:
+        return
+    try:
+        keys = [key async for key in redis_client.scan_iter(
+            match=f"wf_list:{project_id}:*")]
+        if keys:
+            await redis_client.delete(*keys)
+    except Exception as e:
+        logger.warning(f"Failed to invalidate workflow list cache: {str(e)}")
+
+
 # Create router instance
 router = APIRouter(
     prefix="/projects/{project_id}/workflows",
@@ -142,35 +243,59 @@ router = APIRouter(
 )
 
 
-@router.get("/", response_model=WorkflowListResponse)
+@router.get("/", response_model=WorkflowListResponse,
+            response_class=_WorkflowJSONResponse)
 async def list_workflows(
     project_id: str = FastAPIPath(..., description="Project ID"),
-    status: Optional[str] = Query(None, description="Filter by workflow status"),
-    execution_mode: Optional[str] = Query(None, description="Filter by execution mode"),
+    status: Optional[WorkflowStatusName] = Query(
+        None, description="Filter by workflow status"),
+    execution_mode: Optional[ExecutionModeName] = Query(
+        None, description="Filter by execution mode"),
+    limit: int = Query(50, ge=1, le=500, description="Maximum workflows to return"),
+    offset: int = Query(0, ge=0, description="Number of workflows to skip"),
     current_user: dict = Depends(get_current_user),
     workflow_service: WorkflowService = Depends(),
-    project_service: ProjectService = Depends()
+    project_service: ProjectService = Depends(),
+    redis_client=Depends(get_redis_client)
 ):
     """
     List all workflows in a project.
 
-    Returns all workflows associated with the specified project. Supports
-    filtering by status and execution mode.
+    Returns one page of the workflows associated with the specified project,
+    with ``total`` counting all matches. Status and execution mode filters
+    apply to both the page and the total. Serialized responses are cached
+    in Redis for a few seconds and dropped whenever a workflow changes.
     """
     try:
         # Verify project exists and user has access
-        project = await project_service.get_project(project_id, current_user["id"])
+        project = await project_service.get_project_cached(
+            project_id, current_user["id"])
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
 
-        # Get workflows for the project
-        workflows_data = await workflow_service.search_workflows(
-            criteria={"project_id": project_id}
+        cache_key = _workflow_list_key(
+            project_id, status, execution_mode, limit, offset)
+        if redis_client is not None:
+            try:
+                cached = await redis_client.get(cache_key)
+            except Exception as e:
+                logger.warning(f"Workflow list cache read failed: {str(e)}")
+                cached = None
+            if cached is not None:
+                return Response(content=cached, media_type="application/json")
+
+        # Fetch one page and the total match count concurrently
+        criteria = WorkflowSearchCriteria(
+            project_id=project_id, status=status, execution_mode=execution_mode,
+            limit=limit, offset=offset)
+        workflows_data, total = await asyncio.gather(
+            workflow_service.search_workflows(criteria),
+            workflow_service.count_workflows(criteria)
         )
 
-        # Convert to response format
+        # Convert to response format (service data is trusted, skip validation)
         workflows = [
-            WorkflowSummary(
+            WorkflowSummary.model_construct(
                 id=workflow.id,
                 name=workflow.name,
                 execution_mode=workflow.execution_mode.value,
@@ -182,28 +307,40 @@ async def list_workflows(
             for workflow in workflows_data
         ]
 
-        return WorkflowListResponse(
+        response = WorkflowListResponse.model_construct(
             workflows=workflows,
-            total=len(workflows)
+            total=total
         )
+        if redis_client is None:
+            return response
+
+        body = response.model_dump_json()
+        try:
+            await redis_client.set(cache_key, body, ex=WORKFLOW_LIST_CACHE_TTL)
+        except Exception as e:
+            logger.warning(f"Workflow list cache write failed: {str(e)}")
+        return Response(content=body, media_type="application/json")
 
     except HTTPException:
         raise
     except EngineError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception as e:
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@router.post("/", response_model=WorkflowResponse)
+@router.post("/", response_model=WorkflowResponse,
+             response_class=_WorkflowJSONResponse)
 async def create_workflow(
+    background_tasks: BackgroundTasks,
     project_id: str = FastAPIPath(..., description="Project ID"),
     current_user: dict = Depends(get_current_user),
     workflow_service: WorkflowService = Depends(),
     project_service: ProjectService = Depends(),
     agent_service: AgentService = Depends(),
     event_broadcaster=Depends(get_event_broadcaster),
-    workflow_data: WorkflowCreate = Depends()
+    redis_client=Depends(get_redis_client),
+    workflow_data: WorkflowCreate = ...
 ):
     """
     Create a new workflow in a project.
@@ -213,7 +350,8 @@ async def create_workflow(
     """
     try:
         # Verify project exists and user has access
-        project = await project_service.get_project(project_id, current_user["id"])
+        project = await project_service.get_project_cached(
+            project_id, current_user["id"])
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
 
@@ -224,54 +362,19 @@ async def create_workflow(
                 status_code=400, detail=f"Workflow with ID '{
                     workflow_data.id}' already exists in project")
 
-        # Validate execution mode
-        try:
-            execution_mode = ExecutionMode(workflow_data.execution_mode)
-        except ValueError:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid execution mode: {workflow_data.execution_mode}"
-            )
+        # Execution mode is validated by WorkflowCreate
+        execution_mode = _EXECUTION_MODES[workflow_data.execution_mode]
+
+        # Validated request lists are the single copy used for service,
+        # response and event payloads
+        vertices = workflow_data.vertices
+        edges = workflow_data.edges
 
         # Verify all agents exist in the project
-        agent_ids = {vertex.agent_id for vertex in workflow_data.vertices}
-        for agent_id in agent_ids:
-            agent = await agent_service.get_agent(agent_id)
-            if not agent:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Agent '{agent_id}' not found in project"
-                )
-
-        # Validate vertex dependencies
-        vertex_ids = {vertex.id for vertex in workflow_data.vertices}
-        for vertex in workflow_data.vertices:
-            for dep_id in vertex.dependencies:
-                if dep_id not in vertex_ids:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Dependency '{dep_id}' not found in vertices"
-                    )
-
-        # Validate edges
-        for edge in workflow_data.edges:
-            if edge.from_vertex_id not in vertex_ids:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Edge source vertex '{edge.from_vertex_id}' not found"
-                )
-            if edge.to_vertex_id not in vertex_ids:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Edge target vertex '{edge.to_vertex_id}' not found"
-                )
-
-        # Check for cycles in the graph
-        if await workflow_service.has_cycles(workflow_data.vertices, workflow_data.edges):
-            raise HTTPException(
-                status_code=400,
-                detail="Workflow contains cycles - DAG structure required"
-            )
+        await _verify_agents(agent_service, _collect_agent_ids(vertices))
+
+        # Validate dependencies, edges and acyclicity
+        await _validate_dag(workflow_service, vertices, edges)
 
         # Create the workflow
         workflow = await workflow_service.create_workflow(
@@ -279,37 +382,43 @@ async def create_workflow(
             id=workflow_data.id,
             name=workflow_data.name,
             execution_mode=execution_mode,
-            vertices=workflow_data.vertices,
-            edges=workflow_data.edges,
+            vertices=vertices,
+            edges=edges,
             description=workflow_data.description
         )
 
-        # Prepare response
-        response = WorkflowResponse(
+        # Prepare response from the request lists; the service copy on
+        # ``workflow.vertices``/``workflow.edges`` is never read
+        response = WorkflowResponse.model_construct(
             id=workflow.id,
             name=workflow.name,
             execution_mode=workflow.execution_mode.value,
-            vertices=workflow_data.vertices,
-            edges=workflow_data.edges,
+            vertices=vertices,
+            edges=edges,
             description=workflow.description,
             status=workflow.status.value,
             created_at=workflow.created_at,
             updated_at=workflow.updated_at,
-            vertex_count=len(workflow_data.vertices),
-            edge_count=len(workflow_data.edges)
+            vertex_count=len(vertices),
+            edge_count=len(edges)
         )
 
+        project_service.invalidate_project_cache(project_id, current_user["id"])
+        await _invalidate_workflow_lists(redis_client, project_id)
+
         # Broadcast workflow creation event
-        await event_broadcaster.broadcast_event(
+        background_tasks.add_task(
+            _broadcast_event,
+            event_broadcaster,
             event_type=EventType.WORKFLOW_CREATED,
             data={
                 "project_id": project_id,
                 "workflow_id": workflow.id,
                 "workflow_name": workflow.name,
-                "vertex_count": len(workflow_data.vertices),
-                "edge_count": len(workflow_data.edges)
+                "vertex_count": len(vertices),
+                "edge_count": len(edges)
             },
-            user_id=current_user["id"]
+            target_user_id=current_user["id"]
         )
 
         return response
@@ -317,13 +426,15 @@ async def create_workflow(
     except HTTPException:
         raise
     except EngineError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception as e:
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@router.put("/{workflow_id}", response_model=WorkflowResponse)
+@router.put("/{workflow_id}", response_model=WorkflowResponse,
+            response_class=_WorkflowJSONResponse)
 async def update_workflow(
+    background_tasks: BackgroundTasks,
     project_id: str = FastAPIPath(..., description="Project ID"),
     workflow_id: str = FastAPIPath(..., description="Workflow ID"),
     current_user: dict = Depends(get_current_user),
@@ -331,6 +442,7 @@ async def update_workflow(
     project_service: ProjectService = Depends(),
     agent_service: AgentService = Depends(),
     event_broadcaster=Depends(get_event_broadcaster),
+    redis_client=Depends(get_redis_client),
     workflow_data: WorkflowUpdate = ...
 ):
     """
@@ -341,7 +453,8 @@ async def update_workflow(
     """
     try:
         # Verify project exists and user has access
-        project = await project_service.get_project(project_id, current_user["id"])
+        project = await project_service.get_project_cached(
+            project_id, current_user["id"])
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
 
@@ -357,29 +470,22 @@ async def update_workflow(
                 detail="Cannot update workflow with running executions"
             )
 
-        # Validate updates (similar to create, but only for changed fields)
-        update_data = workflow_data.model_dump(exclude_unset=True)
+        # Validate updates (similar to create, but only for changed fields).
+        # Read set fields directly so nested vertices/edges are not dumped.
+        update_data = {
+            name: getattr(workflow_data, name)
+            for name in workflow_data.__pydantic_fields_set__
+        }
 
-        # Validate execution mode if changed
-        if "execution_mode" in update_data:
-            try:
-                ExecutionMode(update_data["execution_mode"])
-            except ValueError:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid execution mode: {update_data['execution_mode']}"
-                )
-
-        # Validate agents if vertices changed
+        # Validate agents if vertices changed, and the DAG if either side did.
+        # The unchanged side comes from the stored workflow as plain dicts.
         if "vertices" in update_data:
-            agent_ids = {vertex.agent_id for vertex in update_data["vertices"]}
-            for agent_id in agent_ids:
-                agent = await agent_service.get_agent(agent_id)
-                if not agent:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Agent '{agent_id}' not found in project"
-                    )
+            await _verify_agents(
+                agent_service, _collect_agent_ids(workflow_data.vertices))
+        if "vertices" in update_data or "edges" in update_data:
+            vertices = update_data.get("vertices", workflow.vertices)
+            edges = update_data.get("edges", workflow.edges)
+            await _validate_dag(workflow_service, vertices or [], edges or [])
 
         # Update the workflow
         updated_workflow = await workflow_service.update_workflow(
@@ -388,8 +494,8 @@ async def update_workflow(
             **update_data
         )
 
-        # Prepare response
-        response = WorkflowResponse(
+        # Prepare response from trusted service data
+        response = WorkflowResponse.model_construct(
             id=updated_workflow.id,
             name=updated_workflow.name,
             execution_mode=updated_workflow.execution_mode.value,
@@ -403,15 +509,21 @@ async def update_workflow(
             edge_count=len(updated_workflow.edges)
         )
 
+        project_service.invalidate_project_cache(project_id, current_user["id"])
+        await _invalidate_workflow_lists(redis_client, project_id)
+
         # Broadcast workflow update event
-        await event_broadcaster.broadcast_event(
+        background_tasks.add_task(
+            _broadcast_event,
+            event_broadcaster,
             event_type=EventType.WORKFLOW_UPDATED,
             data={
                 "project_id": project_id,
                 "workflow_id": workflow_id,
-                "changes": update_data
+                "changes": workflow_data.model_dump(
+                    include=update_data.keys() - _GRAPH_FIELDS)
             },
-            user_id=current_user["id"]
+            target_user_id=current_user["id"]
         )
 
         return response
@@ -419,19 +531,21 @@ async def update_workflow(
     except HTTPException:
         raise
     except EngineError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception as e:
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @router.delete("/{workflow_id}")
 async def delete_workflow(
+    background_tasks: BackgroundTasks,
     project_id: str = FastAPIPath(..., description="Project ID"),
     workflow_id: str = FastAPIPath(..., description="Workflow ID"),
     current_user: dict = Depends(get_current_user),
     workflow_service: WorkflowService = Depends(),
     project_service: ProjectService = Depends(),
-    event_broadcaster=Depends(get_event_broadcaster)
+    event_broadcaster=Depends(get_event_broadcaster),
+    redis_client=Depends(get_redis_client)
 ):
     """
     Delete a workflow.
@@ -440,7 +554,8 @@ async def delete_workflow(
     """
     try:
         # Verify project exists and user has access
-        project = await project_service.get_project(project_id, current_user["id"])
+        project = await project_service.get_project_cached(
+            project_id, current_user["id"])
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
 
@@ -459,15 +574,20 @@ async def delete_workflow(
         # Delete the workflow
         await workflow_service.delete_workflow(project_id, workflow_id)
 
+        project_service.invalidate_project_cache(project_id, current_user["id"])
+        await _invalidate_workflow_lists(redis_client, project_id)
+
         # Broadcast workflow deletion event
-        await event_broadcaster.broadcast_event(
+        background_tasks.add_task(
+            _broadcast_event,
+            event_broadcaster,
             event_type=EventType.WORKFLOW_DELETED,
             data={
                 "project_id": project_id,
                 "workflow_id": workflow_id,
                 "workflow_name": workflow.name
             },
-            user_id=current_user["id"]
+            target_user_id=current_user["id"]
         )
 
         return {"success": True, "message": "Workflow deleted successfully"}
@@ -475,19 +595,21 @@ async def delete_workflow(
     except HTTPException:
         raise
     except EngineError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception as e:
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @router.post("/{workflow_id}/execute", response_model=WorkflowExecutionResponse)
 async def execute_workflow(
+    background_tasks: BackgroundTasks,
     project_id: str = FastAPIPath(..., description="Project ID"),
     workflow_id: str = FastAPIPath(..., description="Workflow ID"),
     current_user: dict = Depends(get_current_user),
     workflow_service: WorkflowService = Depends(),
     project_service: ProjectService = Depends(),
     event_broadcaster=Depends(get_event_broadcaster),
+    redis_client=Depends(get_redis_client),
     execution_data: WorkflowExecution = Depends()
 ):
     """
@@ -498,7 +620,8 @@ async def execute_workflow(
     """
     try:
         # Verify project exists and user has access
-        project = await project_service.get_project(project_id, current_user["id"])
+        project = await project_service.get_project_cached(
+            project_id, current_user["id"])
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
 
@@ -514,7 +637,7 @@ async def execute_workflow(
             )
 
         # Generate execution ID
-        execution_id = f"wf_exec_{uuid.uuid4().hex[:12]}"
+        execution_id = f"wf_exec_{secrets.token_hex(6)}"
 
         # Start workflow execution
         execution = await workflow_service.execute_workflow(
@@ -537,8 +660,13 @@ async def execute_workflow(
             estimated_completion=execution.estimated_completion
         )
 
+        project_service.invalidate_project_cache(project_id, current_user["id"])
+        await _invalidate_workflow_lists(redis_client, project_id)
+
         # Broadcast execution started event
-        await event_broadcaster.broadcast_event(
+        background_tasks.add_task(
+            _broadcast_event,
+            event_broadcaster,
             event_type=EventType.WORKFLOW_EXECUTION_STARTED,
             data={
                 "project_id": project_id,
@@ -547,7 +675,7 @@ async def execute_workflow(
                 "vertex_count": len(workflow.vertices),
                 "input_data": execution_data.input_data
             },
-            user_id=current_user["id"]
+            target_user_id=current_user["id"]
         )
 
         return response
@@ -555,17 +683,26 @@ async def execute_workflow(
     except HTTPException:
         raise
     except EngineError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception as e:
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+# Health bodies are reused for this long; probes tolerate a stale timestamp
+HEALTH_CACHE_TTL_SECONDS = 0.5
+_health_cache: Dict[str, Any] = {"ts": float("-inf"), "body": None}
+
+
 # Health check endpoint for workflows
 @router.get("/health")
 async def workflows_health():
     """Health check endpoint for workflows service"""
-    return {
-        "service": "workflows",
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat()
-    }
+    now = time.monotonic()
+    if now - _health_cache["ts"] > HEALTH_CACHE_TTL_SECONDS:
+        _health_cache["body"] = {
+            "service": "workflows",
+            "status": "healthy",
+            "timestamp": datetime.utcnow().isoformat()
+        }
+        _health_cache["ts"] = now
+    return _health_cache["body"]
@@ -1,11 +1,39 @@
 # Base Schemas for API
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import os
+from datetime import datetime, timezone
+from typing import Any, ClassVar, Dict, List, Mapping, Optional, Tuple
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
+from pydantic_core import PydanticUndefined
 
 # This module contains base schemas used across all API endpoints
 
+# Request/response DTOs are immutable; unknown fields are rejected, not ignored
+SCHEMA_CONFIG = ConfigDict(frozen=True, extra="forbid", populate_by_name=True)
+# For rarely used schemas: validators are built on first use, not at import
+LAZY_SCHEMA_CONFIG = ConfigDict(**SCHEMA_CONFIG, defer_build=True)
+
+
+def utcnow() -> datetime:
+    """Timezone-aware UTC timestamp for default factories."""
+    return datetime.now(timezone.utc)
+
+
+# Production builds that do not serve OpenAPI docs can drop field descriptions
+STRIP_SCHEMA_DOCS = bool(os.getenv("ENGINE_STRIP_SCHEMA_DOCS"))
+
+
+def SchemaField(
+    default: Any = PydanticUndefined,
+    *,
+    description: Optional[str] = None,
+    **kwargs: Any,
+) -> Any:
+    """Pydantic ``Field`` whose description is omitted when STRIP_SCHEMA_DOCS is set."""
+    if STRIP_SCHEMA_DOCS:
+        description = None
+    return Field(default, description=description, **kwargs)
+
 
 class BaseResponseSchema(BaseModel):
     """Base response schema with common fields."""
@@ -20,6 +48,39 @@ class BaseResponseSchema(BaseModel):
         json_encoders = {datetime: lambda v: v.isoformat()}
 
 
+class ResponseDataSchema(BaseModel):
+    """Base schema for read-only response payloads."""
+
+    # Field names captured once per subclass for from_row
+    _row_fields: ClassVar[Tuple[str, ...]] = ()
+    # List[cls] adapter, built on the first validate_many call per subclass
+    _list_adapter: ClassVar[Optional[TypeAdapter]] = None
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._row_fields = tuple(cls.model_fields)
+        cls._list_adapter = None
+
+    @classmethod
+    def validate_many(cls, rows: List[Any]) -> List[Any]:
+        """Validate a batch of rows or ORM objects in a single call."""
+        if cls._list_adapter is None:
+            cls._list_adapter = TypeAdapter(List[cls])
+        return cls._list_adapter.validate_python(rows, from_attributes=True)
+
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]):
+        """Build from a trusted row without validation (extra keys dropped)."""
+        return cls.model_construct(
+            **{name: row[name] for name in cls._row_fields if name in row}
+        )
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON bytes in a single pydantic-core pass."""
+        return self.__pydantic_serializer__.to_json(self)
+
+
 class PaginationSchema(BaseModel):
     """Pagination schema for list responses."""
 
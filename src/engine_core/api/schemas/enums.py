@@ -2,6 +2,9 @@
 # This module contains all enumeration types used in the API schemas
 
 from enum import Enum
+from typing import Annotated, Any, Literal
+
+from pydantic import BeforeValidator
 
 
 class AgentStatus(str, Enum):
@@ -163,3 +166,44 @@ class EmbeddingModel(str, Enum):
     SENTENCE_TRANSFORMERS = "sentence-transformers/all-mpnet-base-v2"
     OPENAI_ADA = "text-embedding-ada-002"
     COHERE = "embed-multilingual-v2.0"
+
+
+def _enum_value(value: Any) -> Any:
+    """Unwrap an enum member to its value so Literal aliases accept both."""
+    return value.value if isinstance(value, Enum) else value
+
+
+# Literal mirrors of the enums used in request/response schemas. pydantic-core
+# validates these with a plain string lookup and no enum member conversion;
+# Python callers passing enum members are unwrapped first by _enum_value.
+# Keep each in sync with its enum above.
+WorkflowStatusName = Annotated[
+    Literal["created", "running", "paused", "completed", "failed", "cancelled"],
+    BeforeValidator(_enum_value),
+]
+ToolTypeName = Annotated[
+    Literal["api", "cli", "mcp", "web"], BeforeValidator(_enum_value)
+]
+ProtocolTypeName = Annotated[
+    Literal["semantic", "workflow", "command", "custom"],
+    BeforeValidator(_enum_value),
+]
+AuthenticationTypeName = Annotated[
+    Literal["none", "basic", "bearer_token", "api_key", "oauth2"],
+    BeforeValidator(_enum_value),
+]
+VertexTypeName = Annotated[
+    Literal["agent_task", "human_task", "system_task", "conditional", "parallel"],
+    BeforeValidator(_enum_value),
+]
+EdgeTypeName = Annotated[
+    Literal["sequence", "conditional", "parallel", "loop"],
+    BeforeValidator(_enum_value),
+]
+CommandTypeName = Annotated[
+    Literal["semantic", "direct", "composite"], BeforeValidator(_enum_value)
+]
+ParameterTypeName = Annotated[
+    Literal["string", "integer", "float", "boolean", "array", "object", "file"],
+    BeforeValidator(_enum_value),
+]
@@ -1,10 +1,18 @@
 # Protocol Schemas for API
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
-from .enums import CommandType, ParameterType, ProtocolType
+from .base_schemas import (
+    LAZY_SCHEMA_CONFIG,
+    SCHEMA_CONFIG,
+    ResponseDataSchema,
+    SchemaField,
+    utcnow,
+)
+from .enums import CommandTypeName, ParameterTypeName, ProtocolTypeName
+from .validators import SemVer
 
 # This module contains Pydantic schemas for protocol-related API operations
 
@@ -12,62 +20,70 @@ from .enums import CommandType, ParameterType, ProtocolType
 class ProtocolCommandSchema(BaseModel):
     """Schema for protocol command."""
 
-    command_name: str = Field(..., description="Command name")
-    command_type: CommandType = Field(..., description="Command type")
-    description: str = Field(..., description="Command description")
-    semantic_patterns: List[str] = Field(
-        default_factory=list, description="Semantic patterns"
+    model_config = SCHEMA_CONFIG
+
+    command_name: str = SchemaField(..., description="Command name")
+    command_type: CommandTypeName = SchemaField(..., description="Command type")
+    description: str = SchemaField(..., description="Command description")
+    semantic_patterns: Tuple[str, ...] = SchemaField(
+        default=(), description="Semantic patterns"
     )
-    execution_order: int = Field(..., description="Execution order")
-    required_parameters: List[str] = Field(
-        default_factory=list, description="Required parameters"
+    execution_order: int = SchemaField(..., description="Execution order")
+    required_parameters: Tuple[str, ...] = SchemaField(
+        default=(), description="Required parameters"
     )
-    optional_parameters: List[str] = Field(
-        default_factory=list, description="Optional parameters"
+    optional_parameters: Tuple[str, ...] = SchemaField(
+        default=(), description="Optional parameters"
     )
-    timeout_seconds: int = Field(default=300, description="Timeout in seconds")
+    timeout_seconds: int = SchemaField(default=300, description="Timeout in seconds")
 
 
 class CommandParameterSchema(BaseModel):
     """Schema for command parameter."""
 
-    parameter_name: str = Field(..., description="Parameter name")
-    parameter_type: ParameterType = Field(..., description="Parameter type")
-    required: bool = Field(default=True, description="Required flag")
-    description: str = Field(..., description="Parameter description")
-    validation_rules: Dict[str, Any] = Field(
+    model_config = SCHEMA_CONFIG
+
+    parameter_name: str = SchemaField(..., description="Parameter name")
+    parameter_type: ParameterTypeName = SchemaField(..., description="Parameter type")
+    required: bool = SchemaField(default=True, description="Required flag")
+    description: str = SchemaField(..., description="Parameter description")
+    validation_rules: Dict[str, Any] = SchemaField(
         default_factory=dict, description="Validation rules"
     )
-    default_value: Any = Field(default=None, description="Default value")
+    default_value: Any = SchemaField(default=None, description="Default value")
 
 
 class ProtocolExecutionSchema(BaseModel):
     """Schema for protocol execution."""
 
-    protocol_id: str = Field(..., description="Protocol ID")
-    execution_id: str = Field(..., description="Execution ID")
-    agent_id: str = Field(..., description="Agent ID")
-    status: str = Field(..., description="Execution status")
-    started_at: datetime = Field(
-        default_factory=datetime.utcnow, description="Start time"
-    )
-    input_parameters: Dict[str, Any] = Field(
+    model_config = LAZY_SCHEMA_CONFIG
+
+    protocol_id: str = SchemaField(..., description="Protocol ID")
+    execution_id: str = SchemaField(..., description="Execution ID")
+    agent_id: str = SchemaField(..., description="Agent ID")
+    status: str = SchemaField(..., description="Execution status")
+    started_at: datetime = SchemaField(default_factory=utcnow, description="Start time")
+    input_parameters: Dict[str, Any] = SchemaField(
         default_factory=dict, description="Input parameters"
     )
-    context: Dict[str, Any] = Field(
+    context: Dict[str, Any] = SchemaField(
         default_factory=dict, description="Execution context"
     )
-    progress_percentage: float = Field(default=0.0, description="Progress percentage")
+    progress_percentage: float = SchemaField(
+        default=0.0, description="Progress percentage"
+    )
 
 
 class ProtocolCreateSchema(BaseModel):
     """Schema for creating a new protocol."""
 
-    name: str = Field(..., description="Protocol name")
-    description: str = Field(..., description="Protocol description")
-    version: str = Field(..., description="Protocol version")
-    protocol_type: ProtocolType = Field(..., description="Protocol type")
-    configuration: Dict[str, Any] = Field(
+    model_config = SCHEMA_CONFIG
+
+    name: str = SchemaField(..., description="Protocol name")
+    description: str = SchemaField(..., description="Protocol description")
+    version: SemVer = SchemaField(..., description="Protocol version")
+    protocol_type: ProtocolTypeName = SchemaField(..., description="Protocol type")
+    configuration: Dict[str, Any] = SchemaField(
         default_factory=dict, description="Protocol configuration"
     )
 
@@ -75,23 +91,33 @@ class ProtocolCreateSchema(BaseModel):
 class ProtocolUpdateSchema(BaseModel):
     """Schema for updating an existing protocol."""
 
-    name: Optional[str] = Field(default=None, description="Protocol name")
-    description: Optional[str] = Field(default=None, description="Protocol description")
-    version: Optional[str] = Field(default=None, description="Protocol version")
-    configuration: Optional[Dict[str, Any]] = Field(
+    model_config = SCHEMA_CONFIG
+
+    name: Optional[str] = SchemaField(default=None, description="Protocol name")
+    description: Optional[str] = SchemaField(
+        default=None, description="Protocol description"
+    )
+    version: Optional[SemVer] = SchemaField(
+        default=None, description="Protocol version"
+    )
+    configuration: Optional[Dict[str, Any]] = SchemaField(
         default=None, description="Protocol configuration"
     )
-    active: Optional[bool] = Field(default=None, description="Protocol active status")
+    active: Optional[bool] = SchemaField(
+        default=None, description="Protocol active status"
+    )
 
 
-class ProtocolResponseSchema(BaseModel):
+class ProtocolResponseSchema(ResponseDataSchema):
     """Schema for protocol response data."""
 
-    id: str = Field(..., description="Protocol ID")
-    name: str = Field(..., description="Protocol name")
-    description: str = Field(..., description="Protocol description")
-    version: str = Field(..., description="Protocol version")
-    protocol_type: ProtocolType = Field(..., description="Protocol type")
-    active: bool = Field(default=True, description="Protocol active status")
-    created_at: datetime = Field(..., description="Creation timestamp")
-    updated_at: datetime = Field(..., description="Last update timestamp")
+    model_config = SCHEMA_CONFIG
+
+    id: str = SchemaField(..., description="Protocol ID")
+    name: str = SchemaField(..., description="Protocol name")
+    description: str = SchemaField(..., description="Protocol description")
+    version: str = SchemaField(..., description="Protocol version")
+    protocol_type: ProtocolTypeName = SchemaField(..., description="Protocol type")
+    active: bool = SchemaField(default=True, description="Protocol active status")
+    created_at: datetime = SchemaField(..., description="Creation timestamp")
+    updated_at: datetime = SchemaField(..., description="Last update timestamp")
@@ -1,10 +1,18 @@
 # Tool Schemas for API
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, Literal, Optional, Tuple, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, model_validator
 
-from engine_core.api.schemas.enums import AuthenticationType, ToolType
+from engine_core.api.schemas.base_schemas import (
+    LAZY_SCHEMA_CONFIG,
+    SCHEMA_CONFIG,
+    ResponseDataSchema,
+    SchemaField,
+    utcnow,
+)
+from engine_core.api.schemas.enums import AuthenticationTypeName, ToolTypeName
+from engine_core.api.schemas.validators import SemVer
 
 # This module contains Pydantic schemas for tool-related API operations
 
@@ -12,15 +20,22 @@ from engine_core.api.schemas.enums import AuthenticationType, ToolType
 class MCPToolConfigSchema(BaseModel):
     """Schema for MCP tool configuration."""
 
-    server_url: str = Field(..., description="MCP server URL")
-    protocol_version: str = Field(..., description="Protocol version")
-    capabilities: List[str] = Field(
-        default_factory=list, description="Tool capabilities"
+    model_config = SCHEMA_CONFIG
+
+    type: Literal["mcp"] = SchemaField(
+        default="mcp", description="Configuration type tag"
+    )
+    server_url: str = SchemaField(..., description="MCP server URL")
+    protocol_version: Optional[str] = SchemaField(
+        default=None, description="Protocol version"
     )
-    connection_config: Dict[str, Any] = Field(
+    capabilities: Tuple[str, ...] = SchemaField(
+        default=(), description="Tool capabilities"
+    )
+    connection_config: Dict[str, Any] = SchemaField(
         default_factory=dict, description="Connection configuration"
     )
-    authentication: Dict[str, Any] = Field(
+    authentication: Dict[str, Any] = SchemaField(
         default_factory=dict, description="Authentication configuration"
     )
 
@@ -28,87 +43,170 @@ class MCPToolConfigSchema(BaseModel):
 class CLIToolConfigSchema(BaseModel):
     """Schema for CLI tool configuration."""
 
-    executable_path: str = Field(..., description="Executable path")
-    default_args: List[str] = Field(
-        default_factory=list, description="Default arguments"
+    model_config = SCHEMA_CONFIG
+
+    type: Literal["cli"] = SchemaField(
+        default="cli", description="Configuration type tag"
     )
-    environment_variables: Dict[str, str] = Field(
+    executable_path: str = SchemaField(..., description="Executable path")
+    default_args: Tuple[str, ...] = SchemaField(
+        default=(), description="Default arguments"
+    )
+    environment_variables: Dict[str, str] = SchemaField(
         default_factory=dict, description="Environment variables"
     )
-    working_directory: str = Field(..., description="Working directory")
-    timeout_seconds: int = Field(default=30, description="Timeout in seconds")
-    shell_required: bool = Field(default=False, description="Shell required flag")
+    working_directory: Optional[str] = SchemaField(
+        default=None, description="Working directory"
+    )
+    timeout_seconds: int = SchemaField(default=30, description="Timeout in seconds")
+    shell_required: bool = SchemaField(default=False, description="Shell required flag")
 
 
 class APIToolConfigSchema(BaseModel):
     """Schema for API tool configuration."""
 
-    base_url: str = Field(..., description="Base URL")
-    authentication_type: AuthenticationType = Field(
-        ..., description="Authentication type"
+    model_config = SCHEMA_CONFIG
+
+    type: Literal["api"] = SchemaField(
+        default="api", description="Configuration type tag"
     )
-    authentication_config: Dict[str, Any] = Field(
+    base_url: str = SchemaField(..., description="Base URL")
+    authentication_type: AuthenticationTypeName = SchemaField(
+        default="none", description="Authentication type"
+    )
+    authentication_config: Dict[str, Any] = SchemaField(
         default_factory=dict, description="Authentication configuration"
     )
-    default_headers: Dict[str, str] = Field(
+    default_headers: Dict[str, str] = SchemaField(
         default_factory=dict, description="Default headers"
     )
-    rate_limit_config: Dict[str, Any] = Field(
+    rate_limit_config: Dict[str, Any] = SchemaField(
         default_factory=dict, description="Rate limit configuration"
     )
-    timeout_seconds: int = Field(default=30, description="Timeout in seconds")
-    verify_ssl: bool = Field(default=True, description="SSL verification flag")
+    timeout_seconds: int = SchemaField(default=30, description="Timeout in seconds")
+    verify_ssl: bool = SchemaField(default=True, description="SSL verification flag")
+
+
+class WebToolConfigSchema(BaseModel):
+    """Schema for web tool configuration (free-form, nothing required)."""
+
+    model_config = ConfigDict(**{**SCHEMA_CONFIG, "extra": "allow"})
+
+    type: Literal["web"] = SchemaField(
+        default="web", description="Configuration type tag"
+    )
+
+
+# Tool configuration selected by its "type" tag, so only the matching
+# schema is validated. Required settings mirror validate_tool_configuration.
+ToolConfigurationSchema = Annotated[
+    Union[
+        MCPToolConfigSchema,
+        CLIToolConfigSchema,
+        APIToolConfigSchema,
+        WebToolConfigSchema,
+    ],
+    SchemaField(discriminator="type"),
+]
 
 
 class ToolHealthSchema(BaseModel):
     """Schema for tool health status."""
 
-    tool_id: str = Field(..., description="Tool ID")
-    status: str = Field(..., description="Health status")
-    response_time_ms: float = Field(..., description="Response time in milliseconds")
-    checked_at: datetime = Field(
-        default_factory=datetime.utcnow, description="Check timestamp"
+    model_config = LAZY_SCHEMA_CONFIG
+
+    tool_id: str = SchemaField(..., description="Tool ID")
+    status: str = SchemaField(..., description="Health status")
+    response_time_ms: float = SchemaField(
+        ..., description="Response time in milliseconds"
+    )
+    checked_at: datetime = SchemaField(
+        default_factory=utcnow, description="Check timestamp"
+    )
+    health_data: Dict[str, Any] = SchemaField(
+        default_factory=dict, description="Health data"
+    )
+    error_message: Optional[str] = SchemaField(
+        default=None, description="Error message"
     )
-    health_data: Dict[str, Any] = Field(default_factory=dict, description="Health data")
-    error_message: Optional[str] = Field(default=None, description="Error message")
 
 
 class ToolCreateSchema(BaseModel):
     """Schema for creating a new tool."""
 
-    name: str = Field(..., description="Tool name")
-    tool_type: ToolType = Field(..., description="Tool type")
-    version: str = Field(..., description="Tool version")
-    description: str = Field(..., description="Tool description")
-    configuration: Dict[str, Any] = Field(
-        default_factory=dict, description="Tool configuration"
+    model_config = SCHEMA_CONFIG
+
+    name: str = SchemaField(..., description="Tool name")
+    tool_type: ToolTypeName = SchemaField(..., description="Tool type")
+    version: SemVer = SchemaField(..., description="Tool version")
+    description: str = SchemaField(..., description="Tool description")
+    configuration: ToolConfigurationSchema = SchemaField(
+        default_factory=dict,
+        description="Tool configuration; omitted means an empty configuration",
+    )
+    health_check_enabled: bool = SchemaField(
+        default=True, description="Health check enabled"
     )
-    health_check_enabled: bool = Field(default=True, description="Health check enabled")
+
+    @model_validator(mode="before")
+    @classmethod
+    def tag_configuration(cls, data: Any) -> Any:
+        """
+        Default the configuration type tag to the tool type.
+
+        An omitted or null configuration is validated as an empty one, so its
+        required settings are enforced exactly as for an explicit ``{}``.
+        """
+        if isinstance(data, dict):
+            config = data.get("configuration")
+            if config is None:
+                config = {}
+            tool_type = data.get("tool_type")
+            if isinstance(config, dict) and "type" not in config and tool_type:
+                tag = getattr(tool_type, "value", tool_type)
+                data = {**data, "configuration": {**config, "type": tag}}
+        return data
+
+    @model_validator(mode="after")
+    def check_configuration_type(self) -> "ToolCreateSchema":
+        """Ensure the configuration matches the tool type."""
+        if self.configuration.type != self.tool_type:
+            raise ValueError(
+                f"{self.tool_type} tools cannot use "
+                f"{self.configuration.type} configuration"
+            )
+        return self
 
 
 class ToolUpdateSchema(BaseModel):
     """Schema for updating an existing tool."""
 
-    name: Optional[str] = Field(default=None, description="Tool name")
-    version: Optional[str] = Field(default=None, description="Tool version")
-    description: Optional[str] = Field(default=None, description="Tool description")
-    configuration: Optional[Dict[str, Any]] = Field(
+    model_config = SCHEMA_CONFIG
+
+    name: Optional[str] = SchemaField(default=None, description="Tool name")
+    version: Optional[SemVer] = SchemaField(default=None, description="Tool version")
+    description: Optional[str] = SchemaField(
+        default=None, description="Tool description"
+    )
+    configuration: Optional[Dict[str, Any]] = SchemaField(
         default=None, description="Tool configuration"
     )
-    health_check_enabled: Optional[bool] = Field(
+    health_check_enabled: Optional[bool] = SchemaField(
         default=None, description="Health check enabled"
     )
-    active: Optional[bool] = Field(default=None, description="Tool active status")
+    active: Optional[bool] = SchemaField(default=None, description="Tool active status")
 
 
-class ToolResponseSchema(BaseModel):
+class ToolResponseSchema(ResponseDataSchema):
     """Schema for tool response data."""
 
-    id: str = Field(..., description="Tool ID")
-    name: str = Field(..., description="Tool name")
-    tool_type: ToolType = Field(..., description="Tool type")
-    version: str = Field(..., description="Tool version")
-    description: str = Field(..., description="Tool description")
-    active: bool = Field(default=True, description="Tool active status")
-    created_at: datetime = Field(..., description="Creation timestamp")
-    updated_at: datetime = Field(..., description="Last update timestamp")
+    model_config = SCHEMA_CONFIG
+
+    id: str = SchemaField(..., description="Tool ID")
+    name: str = SchemaField(..., description="Tool name")
+    tool_type: ToolTypeName = SchemaField(..., description="Tool type")
+    version: str = SchemaField(..., description="Tool version")
+    description: str = SchemaField(..., description="Tool description")
+    active: bool = SchemaField(default=True, description="Tool active status")
+    created_at: datetime = SchemaField(..., description="Creation timestamp")
+    updated_at: datetime = SchemaField(..., description="Last update timestamp")
@@ -1,28 +1,68 @@
 # Custom Validators for API Schemas
 import re
-from typing import Any, Dict, List, Optional, Tuple
+from collections import defaultdict
+from functools import lru_cache
+from typing import Annotated, Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
-from pydantic import ValidationError
+from pydantic import AfterValidator, ValidationError
 
 # This module contains custom validation functions used in Pydantic schemas
 
-
-def validate_agent_model(model: str) -> bool:
-    """Validate agent model format."""
-    if not model or not isinstance(model, str):
-        raise ValidationError("Model must be a non-empty string")
-
-    # Valid model patterns
-    valid_patterns = [
+# Patterns are compiled once at import instead of on every validator call
+_MODEL_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
         r"^claude-3\..*$",  # Claude models
         r"^gpt-4.*$",  # GPT-4 models
         r"^gpt-3\.5.*$",  # GPT-3.5 models
         r"^llama-.*$",  # Llama models
         r"^mistral-.*$",  # Mistral models
-    ]
+    )
+]
+# Reference pattern for command names; set _CMDNAME_USE_REGEX for parity checks
+_CMDNAME_RE = re.compile(r"^[a-z][a-z0-9_]*$")
+_CMDNAME_USE_REGEX = False
+
+# Sentinel for absent keys, so present-but-None values are not mistaken for missing
+_MISSING = object()
+# Semantic version pattern (with optional pre-release)
+_SEMVER_RE = re.compile(
+    r"^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)(?:-((?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)(?:\.(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*))?(?:\+([0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?$"
+)
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+# Parent-directory traversal or shell metacharacters in file paths
+_DANGEROUS_PATH_RE = re.compile(r"\.\.|[<>|&;]")
+_UUID_RE = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE
+)
+
+
+def _is_valid_cmd_name(name: str) -> bool:
+    """Check ``[a-z][a-z0-9_]*`` with str methods instead of the regex engine."""
+    if _CMDNAME_USE_REGEX:
+        return _CMDNAME_RE.match(name) is not None
+    return (
+        bool(name)
+        and name.isascii()
+        and name[0].isalpha()
+        and name.islower()
+        and name.replace("_", "").isalnum()
+    )
+
+
+@lru_cache(maxsize=512)
+def _is_valid_model(model: str) -> bool:
+    """Match a model identifier against the known patterns (memoized)."""
+    return any(pattern.match(model) for pattern in _MODEL_PATTERNS)
+
+
+def validate_agent_model(model: str) -> bool:
+    """Validate agent model format."""
+    if not model or not isinstance(model, str):
+        raise ValidationError("Model must be a non-empty string")
 
-    if not any(re.match(pattern, model, re.IGNORECASE) for pattern in valid_patterns):
+    if not _is_valid_model(model):
         raise ValidationError(f"Invalid model format: {model}")
 
     return True
@@ -33,65 +73,82 @@ def validate_workflow_dag(vertices: List[str], edges: List[Tuple[str, str]]) ->
     if not vertices:
         raise ValidationError("Workflow must have at least one vertex")
 
-    # Build adjacency list
-    adj_list = {v: [] for v in vertices}
+    # Build adjacency list; sinks get no entry
+    vertex_set = set(vertices)
+    adj_list: Dict[str, List[str]] = defaultdict(list)
     for source, target in edges:
-        if source not in adj_list or target not in adj_list:
+        if source not in vertex_set or target not in vertex_set:
             raise ValidationError(
                 f"Edge references unknown vertex: {source} -> {target}"
             )
         adj_list[source].append(target)
 
-    # Detect cycles using DFS
-    visited = set()
-    rec_stack = set()
+    # Detect cycles using an iterative three-color DFS (no recursion limit)
+    WHITE, GRAY, BLACK = 0, 1, 2
+    color = dict.fromkeys(vertex_set, WHITE)
+
+    for root in vertices:
+        if color[root] != WHITE:
+            continue
+        color[root] = GRAY
+        stack = [(root, iter(adj_list.get(root, ())))]
+        while stack:
+            vertex, neighbors = stack[-1]
+            for neighbor in neighbors:
+                if color[neighbor] == GRAY:
+                    raise ValidationError("Workflow contains cycles")
+                if color[neighbor] == WHITE:
+                    color[neighbor] = GRAY
+                    stack.append((neighbor, iter(adj_list.get(neighbor, ()))))
+                    break
+            else:
+                color[vertex] = BLACK
+                stack.pop()
 
-    def has_cycle(vertex: str) -> bool:
-        visited.add(vertex)
-        rec_stack.add(vertex)
+    return True
+
+
+_API_REQUIRED = frozenset(["base_url"])
+_CLI_REQUIRED = frozenset(["executable_path"])
+_MCP_REQUIRED = frozenset(["server_url"])
 
-        for neighbor in adj_list[vertex]:
-            if neighbor not in visited:
-                if has_cycle(neighbor):
-                    return True
-            elif neighbor in rec_stack:
-                return True
 
-        rec_stack.remove(vertex)
-        return False
+def _validate_api_config(config: Dict[str, Any]) -> bool:
+    if not config.keys() >= _API_REQUIRED:
+        raise ValidationError("API tools require base_url configuration")
 
-    for vertex in vertices:
-        if vertex not in visited:
-            if has_cycle(vertex):
-                raise ValidationError("Workflow contains cycles")
+    # Validate URL format
+    return validate_url_format(config["base_url"])
 
+
+def _validate_cli_config(config: Dict[str, Any]) -> bool:
+    if not config.keys() >= _CLI_REQUIRED:
+        raise ValidationError("CLI tools require executable_path configuration")
     return True
 
 
-def validate_tool_configuration(tool_type: str, config: Dict[str, Any]) -> bool:
-    """Validate tool configuration based on tool type."""
-    if tool_type == "api":
-        required_fields = ["base_url"]
-        if not all(field in config for field in required_fields):
-            raise ValidationError("API tools require base_url configuration")
+def _validate_mcp_config(config: Dict[str, Any]) -> bool:
+    if not config.keys() >= _MCP_REQUIRED:
+        raise ValidationError("MCP tools require server_url configuration")
 
-        # Validate URL format
-        validate_url_format(config["base_url"])
+    # Validate URL format
+    return validate_url_format(config["server_url"])
 
-    elif tool_type == "cli":
-        required_fields = ["executable_path"]
-        if not all(field in config for field in required_fields):
-            raise ValidationError("CLI tools require executable_path configuration")
 
-    elif tool_type == "mcp":
-        required_fields = ["server_url"]
-        if not all(field in config for field in required_fields):
-            raise ValidationError("MCP tools require server_url configuration")
+# Tool types without an entry have no configuration requirements
+_TOOL_CONFIG_VALIDATORS = {
+    "api": _validate_api_config,
+    "cli": _validate_cli_config,
+    "mcp": _validate_mcp_config,
+}
 
-        # Validate URL format
-        validate_url_format(config["server_url"])
 
-    return True
+def validate_tool_configuration(tool_type: str, config: Dict[str, Any]) -> bool:
+    """Validate tool configuration based on tool type."""
+    validator = _TOOL_CONFIG_VALIDATORS.get(tool_type)
+    if validator is None:
+        return True
+    return validator(config)
 
 
 def validate_protocol_commands(commands: List[Dict[str, Any]]) -> bool:
@@ -99,30 +156,27 @@ def validate_protocol_commands(commands: List[Dict[str, Any]]) -> bool:
     if not commands:
         raise ValidationError("Protocol must have at least one command")
 
-    command_names = set()
-    execution_orders = set()
+    # Map each seen name/order to the index of the command that introduced it
+    command_names: Dict[Any, int] = {}
+    execution_orders: Dict[Any, int] = {}
 
-    for cmd in commands:
+    for index, cmd in enumerate(commands):
         # Check required fields
-        if "command_name" not in cmd:
+        cmd_name = cmd.get("command_name", _MISSING)
+        if cmd_name is _MISSING:
             raise ValidationError("Command must have command_name")
-        if "execution_order" not in cmd:
+        exec_order = cmd.get("execution_order", _MISSING)
+        if exec_order is _MISSING:
             raise ValidationError("Command must have execution_order")
 
-        # Check for duplicates
-        cmd_name = cmd["command_name"]
-        exec_order = cmd["execution_order"]
-
-        if cmd_name in command_names:
+        # Check for duplicates (setdefault returns the earlier index if seen)
+        if command_names.setdefault(cmd_name, index) != index:
             raise ValidationError(f"Duplicate command name: {cmd_name}")
-        if exec_order in execution_orders:
+        if execution_orders.setdefault(exec_order, index) != index:
             raise ValidationError(f"Duplicate execution order: {exec_order}")
 
-        command_names.add(cmd_name)
-        execution_orders.add(exec_order)
-
         # Validate command name format
-        if not re.match(r"^[a-z][a-z0-9_]*$", cmd_name):
+        if not _is_valid_cmd_name(cmd_name):
             raise ValidationError(f"Invalid command name format: {cmd_name}")
 
     return True
@@ -137,29 +191,67 @@ def validate_book_hierarchy(hierarchy: Dict[str, Any]) -> bool:
     pages = hierarchy.get("pages", {})
 
     # Check for orphaned pages
-    for chapter_id, page_list in pages.items():
-        if chapter_id not in chapters:
-            raise ValidationError(f"Orphaned page chapter: {chapter_id}")
+    orphans = pages.keys() - chapters
+    if orphans:
+        raise ValidationError(f"Orphaned page chapter: {next(iter(orphans))}")
 
     return True
 
 
-def validate_url_format(url: str) -> bool:
-    """Validate URL format."""
-    if not url or not isinstance(url, str):
-        raise ValidationError("URL must be a non-empty string")
+# Valid URL schemes
+_URL_SCHEMES = frozenset(["http", "https", "tcp", "udp", "ftp", "ftps"])
+
 
+# The string checks below are pure functions of their input, so the checks
+# are memoized and the public validators only turn a failure into an error.
+@lru_cache(maxsize=4096)
+def _url_format_error(url: str) -> Optional[str]:
+    """Return the validation error message for a URL, or None if it is valid."""
     try:
         parsed = urlparse(url)
-        if not parsed.scheme or not parsed.netloc:
-            raise ValidationError(f"Invalid URL format: {url}")
     except Exception:
-        raise ValidationError(f"Invalid URL format: {url}")
+        return f"Invalid URL format: {url}"
+    if not parsed.scheme or not parsed.netloc:
+        return f"Invalid URL format: {url}"
+    if parsed.scheme not in _URL_SCHEMES:
+        return f"Unsupported URL scheme: {parsed.scheme}"
+    return None
+
+
+@lru_cache(maxsize=4096)
+def is_valid_version(version: str) -> bool:
+    """Check a string against the semantic version pattern (memoized)."""
+    return _SEMVER_RE.match(version) is not None
+
+
+def _check_semver(version: str) -> str:
+    if not is_valid_version(version):
+        raise ValueError(f"Invalid version format: {version}")
+    return version
+
+
+# Field type for schema versions; use Optional[SemVer] for partial updates
+SemVer = Annotated[str, AfterValidator(_check_semver)]
 
-    # Valid schemes
-    valid_schemes = ["http", "https", "tcp", "udp", "ftp", "ftps"]
-    if parsed.scheme not in valid_schemes:
-        raise ValidationError(f"Unsupported URL scheme: {parsed.scheme}")
+
+@lru_cache(maxsize=4096)
+def _is_valid_email(email: str) -> bool:
+    return _EMAIL_RE.match(email) is not None
+
+
+@lru_cache(maxsize=4096)
+def _is_valid_uuid(uuid_str: str) -> bool:
+    return _UUID_RE.match(uuid_str) is not None
+
+
+def validate_url_format(url: str) -> bool:
+    """Validate URL format."""
+    if not url or not isinstance(url, str):
+        raise ValidationError("URL must be a non-empty string")
+
+    error = _url_format_error(url)
+    if error is not None:
+        raise ValidationError(error)
 
     return True
 
@@ -169,10 +261,7 @@ def validate_version_format(version: str) -> bool:
     if not version or not isinstance(version, str):
         raise ValidationError("Version must be a non-empty string")
 
-    # Semantic version pattern (with optional pre-release)
-    pattern = r"^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)(?:-((?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)(?:\.(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*))?(?:\+([0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?$"
-
-    if not re.match(pattern, version):
+    if not is_valid_version(version):
         raise ValidationError(f"Invalid version format: {version}")
 
     return True
@@ -183,8 +272,7 @@ def validate_email_format(email: str) -> bool:
     if not email or not isinstance(email, str):
         raise ValidationError("Email must be a non-empty string")
 
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    if not re.match(pattern, email):
+    if not _is_valid_email(email):
         raise ValidationError(f"Invalid email format: {email}")
 
     return True
@@ -195,8 +283,7 @@ def validate_uuid_format(uuid_str: str) -> bool:
     if not uuid_str or not isinstance(uuid_str, str):
         raise ValidationError("UUID must be a non-empty string")
 
-    pattern = r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"
-    if not re.match(pattern, uuid_str, re.IGNORECASE):
+    if not _is_valid_uuid(uuid_str):
         raise ValidationError(f"Invalid UUID format: {uuid_str}")
 
     return True
@@ -231,9 +318,8 @@ def validate_file_path(path: str) -> bool:
     if not path or not isinstance(path, str):
         raise ValidationError("File path must be a non-empty string")
 
-    # Check for dangerous characters
-    dangerous_chars = ["..", "<", ">", "|", "&", ";"]
-    if any(char in path for char in dangerous_chars):
+    # Check for dangerous characters in one scan
+    if _DANGEROUS_PATH_RE.search(path):
         raise ValidationError(f"File path contains dangerous characters: {path}")
 
     return True
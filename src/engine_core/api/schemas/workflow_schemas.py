@@ -1,10 +1,17 @@
 # Workflow Schemas for API
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
-from .enums import EdgeType, VertexType, WorkflowStatus
+from .base_schemas import (
+    LAZY_SCHEMA_CONFIG,
+    SCHEMA_CONFIG,
+    ResponseDataSchema,
+    SchemaField,
+    utcnow,
+)
+from .enums import EdgeTypeName, VertexTypeName, WorkflowStatusName
 
 # This module contains Pydantic schemas for workflow-related API operations
 
@@ -12,16 +19,18 @@ from .enums import EdgeType, VertexType, WorkflowStatus
 class WorkflowVertexSchema(BaseModel):
     """Schema for workflow vertex."""
 
-    vertex_id: str = Field(..., description="Vertex ID")
-    agent_id: str = Field(..., description="Agent ID")
-    vertex_type: VertexType = Field(..., description="Vertex type")
-    configuration: Dict[str, Any] = Field(
+    model_config = SCHEMA_CONFIG
+
+    vertex_id: str = SchemaField(..., description="Vertex ID")
+    agent_id: str = SchemaField(..., description="Agent ID")
+    vertex_type: VertexTypeName = SchemaField(..., description="Vertex type")
+    configuration: Dict[str, Any] = SchemaField(
         default_factory=dict, description="Vertex configuration"
     )
-    input_schema: Dict[str, Any] = Field(
+    input_schema: Dict[str, Any] = SchemaField(
         default_factory=dict, description="Input schema"
     )
-    output_schema: Dict[str, Any] = Field(
+    output_schema: Dict[str, Any] = SchemaField(
         default_factory=dict, description="Output schema"
     )
 
@@ -29,74 +38,92 @@ class WorkflowVertexSchema(BaseModel):
 class WorkflowEdgeSchema(BaseModel):
     """Schema for workflow edge."""
 
-    source_vertex_id: str = Field(..., description="Source vertex ID")
-    target_vertex_id: str = Field(..., description="Target vertex ID")
-    edge_type: EdgeType = Field(..., description="Edge type")
-    condition: Dict[str, Any] = Field(
+    model_config = SCHEMA_CONFIG
+
+    source_vertex_id: str = SchemaField(..., description="Source vertex ID")
+    target_vertex_id: str = SchemaField(..., description="Target vertex ID")
+    edge_type: EdgeTypeName = SchemaField(..., description="Edge type")
+    condition: Dict[str, Any] = SchemaField(
         default_factory=dict, description="Edge condition"
     )
-    weight: float = Field(default=1.0, description="Edge weight")
+    weight: float = SchemaField(default=1.0, description="Edge weight")
 
 
 class WorkflowExecutionSchema(BaseModel):
     """Schema for workflow execution."""
 
-    workflow_id: str = Field(..., description="Workflow ID")
-    execution_id: str = Field(..., description="Execution ID")
-    status: WorkflowStatus = Field(..., description="Execution status")
-    input_data: Dict[str, Any] = Field(default_factory=dict, description="Input data")
-    context: Dict[str, Any] = Field(
-        default_factory=dict, description="Execution context"
+    model_config = LAZY_SCHEMA_CONFIG
+
+    workflow_id: str = SchemaField(..., description="Workflow ID")
+    execution_id: str = SchemaField(..., description="Execution ID")
+    status: WorkflowStatusName = SchemaField(..., description="Execution status")
+    input_data: Dict[str, Any] = SchemaField(
+        default_factory=dict, description="Input data"
     )
-    started_at: datetime = Field(
-        default_factory=datetime.utcnow, description="Start time"
+    context: Dict[str, Any] = SchemaField(
+        default_factory=dict, description="Execution context"
     )
+    started_at: datetime = SchemaField(default_factory=utcnow, description="Start time")
 
 
 class ExecutionLogSchema(BaseModel):
     """Schema for execution log."""
 
-    execution_id: str = Field(..., description="Execution ID")
-    vertex_id: str = Field(..., description="Vertex ID")
-    log_level: str = Field(..., description="Log level")
-    message: str = Field(..., description="Log message")
-    timestamp: datetime = Field(
-        default_factory=datetime.utcnow, description="Log timestamp"
+    model_config = LAZY_SCHEMA_CONFIG
+
+    execution_id: str = SchemaField(..., description="Execution ID")
+    vertex_id: str = SchemaField(..., description="Vertex ID")
+    log_level: str = SchemaField(..., description="Log level")
+    message: str = SchemaField(..., description="Log message")
+    timestamp: datetime = SchemaField(
+        default_factory=utcnow, description="Log timestamp"
+    )
+    metadata: Dict[str, Any] = SchemaField(
+        default_factory=dict, description="Log metadata"
     )
-    metadata: Dict[str, Any] = Field(default_factory=dict, description="Log metadata")
 
 
 class WorkflowCreateSchema(BaseModel):
     """Schema for creating a new workflow."""
 
-    name: str = Field(..., description="Workflow name")
-    description: str = Field(..., description="Workflow description")
-    workflow_type: str = Field(..., description="Workflow type")
-    configuration: Dict[str, Any] = Field(
+    model_config = SCHEMA_CONFIG
+
+    name: str = SchemaField(..., description="Workflow name")
+    description: str = SchemaField(..., description="Workflow description")
+    workflow_type: str = SchemaField(..., description="Workflow type")
+    configuration: Dict[str, Any] = SchemaField(
         default_factory=dict, description="Workflow configuration"
     )
-    tags: List[str] = Field(default_factory=list, description="Workflow tags")
+    tags: Tuple[str, ...] = SchemaField(default=(), description="Workflow tags")
 
 
 class WorkflowUpdateSchema(BaseModel):
     """Schema for updating an existing workflow."""
 
-    name: Optional[str] = Field(default=None, description="Workflow name")
-    description: Optional[str] = Field(default=None, description="Workflow description")
-    configuration: Optional[Dict[str, Any]] = Field(
+    model_config = SCHEMA_CONFIG
+
+    name: Optional[str] = SchemaField(default=None, description="Workflow name")
+    description: Optional[str] = SchemaField(
+        default=None, description="Workflow description"
+    )
+    configuration: Optional[Dict[str, Any]] = SchemaField(
         default=None, description="Workflow configuration"
     )
-    tags: Optional[List[str]] = Field(default=None, description="Workflow tags")
-    active: Optional[bool] = Field(default=None, description="Workflow active status")
+    tags: Optional[List[str]] = SchemaField(default=None, description="Workflow tags")
+    active: Optional[bool] = SchemaField(
+        default=None, description="Workflow active status"
+    )
 
 
-class WorkflowResponseSchema(BaseModel):
+class WorkflowResponseSchema(ResponseDataSchema):
     """Schema for workflow response data."""
 
-    id: str = Field(..., description="Workflow ID")
-    name: str = Field(..., description="Workflow name")
-    description: str = Field(..., description="Workflow description")
-    workflow_type: str = Field(..., description="Workflow type")
-    active: bool = Field(default=True, description="Workflow active status")
-    created_at: datetime = Field(..., description="Creation timestamp")
-    updated_at: datetime = Field(..., description="Last update timestamp")
+    model_config = SCHEMA_CONFIG
+
+    id: str = SchemaField(..., description="Workflow ID")
+    name: str = SchemaField(..., description="Workflow name")
+    description: str = SchemaField(..., description="Workflow description")
+    workflow_type: str = SchemaField(..., description="Workflow type")
+    active: bool = SchemaField(default=True, description="Workflow active status")
+    created_at: datetime = SchemaField(..., description="Creation timestamp")
+    updated_at: datetime = SchemaField(..., description="Last update timestamp")
@@ -39,23 +39,94 @@ Dependencies:
 """
 
 import asyncio
+import heapq
 import json
 import logging
+import time
 import uuid
 import weakref
 from collections import defaultdict
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 import jwt
 from fastapi import HTTPException, WebSocket, WebSocketDisconnect
-from starlette.websockets import WebSocketState
+
+# Optional fast JSON codec for WebSocket frames
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
+def _json_default(value: Any) -> Any:
+    """Encode values the stdlib encoder does not handle natively."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+
+    def _json_dumps(value: Any) -> str:
+        """Encode a frame payload as JSON text."""
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    _json_loads = orjson.loads
+else:
+
+    def _json_dumps(value: Any) -> str:
+        """Encode a frame payload as JSON text."""
+        return json.dumps(value, default=_json_default)
+
+    _json_loads = json.loads
+
+
+# Static error frames, encoded once at import
+_ERR_INVALID_JSON = _json_dumps({"error": "Invalid JSON format"})
+_ERR_INTERNAL = _json_dumps({"error": "Internal server error"})
+_ERR_PROCESS_FAILED = _json_dumps({"error": "Failed to process message"})
+_ERR_SUBSCRIBE_FAILED = _json_dumps({"error": "Failed to add subscription"})
+_ERR_INVALID_SUBSCRIPTION = _json_dumps({"error": "Invalid subscription request"})
+_ERR_UNSUBSCRIBE_FAILED = _json_dumps({"error": "Failed to remove subscription"})
+_ERR_INVALID_UNSUBSCRIPTION = _json_dumps({"error": "Invalid unsubscription request"})
+_ERR_AUTH_UNSUPPORTED = _json_dumps({"error": "Authentication not supported"})
+_ERR_AUTH_FAILED = _json_dumps({"error": "Authentication failed"})
+
+# Frames sent within this many seconds share one ISO timestamp string
+_TIMESTAMP_RESOLUTION = 0.01
+_timestamp_cache: Tuple[float, str] = (float("-inf"), "")
+
+
+def _utcnow_iso() -> str:
+    """Current UTC time as an ISO string, cached at 10ms granularity."""
+    global _timestamp_cache
+    now = time.monotonic()
+    checked_at, iso = _timestamp_cache
+    if now - checked_at >= _TIMESTAMP_RESOLUTION:
+        iso = datetime.utcnow().isoformat()
+        _timestamp_cache = (now, iso)
+    return iso
+
+
+# Strong references to running background tasks; the event loop only keeps
+# weak ones, so an unreferenced task can be collected while still pending
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def _spawn(coro) -> asyncio.Task:
+    """Create a task that stays referenced until it finishes."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
 class EventType(Enum):
     """Types of events that can be broadcast via WebSocket."""
 
@@ -152,7 +223,7 @@ class SubscriptionScope(Enum):
     BOOK = "book"  # Events for specific book
 
 
-@dataclass
+@dataclass(slots=True)
 class WebSocketMessage:
     """WebSocket message structure."""
 
@@ -166,9 +237,11 @@ class WebSocketMessage:
     user_id: Optional[str] = None
     session_id: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Wire payload, encoded once and shared by every recipient
+    _encoded: Optional[str] = field(default=None, init=False, repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionInfo:
     """Information about a WebSocket connection."""
 
@@ -176,17 +249,23 @@ class ConnectionInfo:
     websocket: WebSocket
     user_id: Optional[str]
     session_id: Optional[str]
-    subscriptions: Set[Tuple[SubscriptionScope, Optional[str]]] = field(
-        default_factory=set
-    )
-    connected_at: datetime = field(default_factory=datetime.utcnow)
-    last_activity: datetime = field(default_factory=datetime.utcnow)
+    # (scope, scope_id) -> subscribed event types; empty means all types
+    subscriptions: Dict[
+        Tuple[SubscriptionScope, Optional[str]], Set[EventType]
+    ] = field(default_factory=dict)
+    # time.monotonic() readings, used only for freshness tracking
+    connected_at: float = field(default_factory=time.monotonic)
+    last_activity: float = field(default_factory=time.monotonic)
     message_count: int = 0
     is_authenticated: bool = False
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Set once the connection is removed from the registry
+    disconnect_event: asyncio.Event = field(
+        default_factory=asyncio.Event, repr=False, compare=False
+    )
 
 
-@dataclass
+@dataclass(slots=True)
 class EventSubscription:
     """Event subscription configuration."""
 
@@ -194,19 +273,81 @@ class EventSubscription:
     scope_id: Optional[str]
     event_types: Set[EventType] = field(default_factory=set)
     filters: Dict[str, Any] = field(default_factory=dict)
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: float = field(default_factory=time.monotonic)
+
+
+# Enum values looked up on every outbound frame
+_EVENT_TYPE_VALUE: Dict[EventType, str] = {e: e.value for e in EventType}
+_SCOPE_VALUE: Dict[SubscriptionScope, str] = {s: s.value for s in SubscriptionScope}
+
+# Reverse lookups for values received from clients
+_EVENT_BY_VALUE: Dict[str, EventType] = {e.value: e for e in EventType}
+_SCOPE_BY_VALUE: Dict[str, SubscriptionScope] = {s.value: s for s in SubscriptionScope}
+
+
+def _serialize_message(message: WebSocketMessage) -> str:
+    """Encode the wire envelope for a message.
+
+    The envelope carries no per-connection fields, so it is encoded on first
+    use and the cached payload is sent to every subscriber.
+    """
+    if message._encoded is not None:
+        return message._encoded
+
+    message._encoded = _json_dumps(
+        {
+            "id": message.id,
+            "event_type": _EVENT_TYPE_VALUE[message.event_type],
+            "data": message.data,
+            "timestamp": message.timestamp,
+            "scope": _SCOPE_VALUE[message.scope],
+            "scope_id": message.scope_id,
+            "metadata": message.metadata,
+        }
+    )
+    return message._encoded
+
+
+# Idle time after which a connection is considered stale
+STALE_CONNECTION_SECONDS = 30 * 60
+
+# Connections sent to concurrently per gather() during a broadcast
+FANOUT_CHUNK_SIZE = 256
+
+# Longest a broadcast waits on one socket before treating it as dead
+SEND_TIMEOUT_SECONDS = 5.0
+
+# Most queued events combined into one frame when batching is enabled
+MAX_BATCH_EVENTS = 100
+
+# How long get_connection_stats() reuses a snapshot across callers
+STATS_CACHE_SECONDS = 1.0
+
+# Errors raised when sending on a closed or closing socket
+_SEND_ERRORS = (RuntimeError, OSError, WebSocketDisconnect)
 
 
 class ConnectionRegistry:
     """Registry for managing WebSocket connections."""
 
     def __init__(self):
-        """Initialize connection registry."""
+        """Initialize connection registry.
+
+        ``connections`` is the only owner of ConnectionInfo objects; every
+        other index stores bare connection ids, so an id left behind by a
+        missed cleanup never keeps a socket alive and is purged on lookup.
+        """
         self.connections: Dict[str, ConnectionInfo] = {}
         self.user_connections: Dict[str, Set[str]] = defaultdict(set)
         self.subscription_index: Dict[
             Tuple[SubscriptionScope, Optional[str]], Set[str]
         ] = defaultdict(set)
+        # Event type -> connection ids; None holds connections taking all types
+        self.event_type_index: Dict[Optional[EventType], Set[str]] = defaultdict(set)
+        self._connection_event_types: Dict[str, Set[Optional[EventType]]] = {}
+        # One (last_activity, connection_id) entry per connection, re-armed
+        # lazily during cleanup when the connection has been active since
+        self._expiry_heap: List[Tuple[float, str]] = []
         self._cleanup_task: Optional[asyncio.Task] = None
 
         # Start cleanup task
@@ -215,6 +356,10 @@ class ConnectionRegistry:
     def add_connection(self, connection_info: ConnectionInfo) -> None:
         """Add connection to registry."""
         self.connections[connection_info.connection_id] = connection_info
+        heapq.heappush(
+            self._expiry_heap,
+            (connection_info.last_activity, connection_info.connection_id),
+        )
 
         if connection_info.user_id:
             self.user_connections[connection_info.user_id].add(
@@ -229,6 +374,7 @@ class ConnectionRegistry:
             return None
 
         connection_info = self.connections.pop(connection_id)
+        connection_info.disconnect_event.set()
 
         # Remove from user connections
         if connection_info.user_id:
@@ -242,6 +388,9 @@ class ConnectionRegistry:
             if not self.subscription_index[subscription]:
                 del self.subscription_index[subscription]
 
+        connection_info.subscriptions.clear()
+        self._reindex_event_types(connection_info)
+
         logger.info(f"Removed WebSocket connection: {connection_id}")
         return connection_info
 
@@ -251,12 +400,14 @@ class ConnectionRegistry:
 
     def get_user_connections(self, user_id: str) -> List[ConnectionInfo]:
         """Get all connections for a user."""
-        connection_ids = self.user_connections.get(user_id, set())
-        return [
-            self.connections[conn_id]
-            for conn_id in connection_ids
-            if conn_id in self.connections
-        ]
+        connection_ids = self.user_connections.get(user_id)
+        if not connection_ids:
+            return []
+
+        connections, dangling = self._resolve(connection_ids)
+        if dangling:
+            self._purge_dangling(dangling, user_id=user_id)
+        return connections
 
     def add_subscription(
         self, connection_id: str, subscription: EventSubscription
@@ -268,8 +419,9 @@ class ConnectionRegistry:
         connection_info = self.connections[connection_id]
         subscription_key = (subscription.scope, subscription.scope_id)
 
-        connection_info.subscriptions.add(subscription_key)
+        connection_info.subscriptions[subscription_key] = set(subscription.event_types)
         self.subscription_index[subscription_key].add(connection_id)
+        self._reindex_event_types(connection_info)
 
         logger.debug(
             f"Added subscription {subscription_key} for connection {connection_id}"
@@ -289,40 +441,154 @@ class ConnectionRegistry:
         connection_info = self.connections[connection_id]
         subscription_key = (scope, scope_id)
 
-        connection_info.subscriptions.discard(subscription_key)
+        connection_info.subscriptions.pop(subscription_key, None)
         self.subscription_index[subscription_key].discard(connection_id)
 
         if not self.subscription_index[subscription_key]:
             del self.subscription_index[subscription_key]
 
+        self._reindex_event_types(connection_info)
+
         logger.debug(
             f"Removed subscription {subscription_key} for connection {connection_id}"
         )
         return True
 
+    def _reindex_event_types(self, connection_info: ConnectionInfo) -> None:
+        """Re-register a connection under the event types it subscribes to."""
+        connection_id = connection_info.connection_id
+        wanted: Set[Optional[EventType]] = set()
+        for event_types in connection_info.subscriptions.values():
+            if not event_types:
+                wanted = {None}
+                break
+            wanted.update(event_types)
+
+        previous = self._connection_event_types.pop(connection_id, set())
+        for event_type in previous - wanted:
+            self.event_type_index[event_type].discard(connection_id)
+            if not self.event_type_index[event_type]:
+                del self.event_type_index[event_type]
+        for event_type in wanted - previous:
+            self.event_type_index[event_type].add(connection_id)
+
+        if wanted:
+            self._connection_event_types[connection_id] = wanted
+
     def get_subscribers(
-        self, scope: SubscriptionScope, scope_id: Optional[str] = None
+        self,
+        scope: SubscriptionScope,
+        scope_id: Optional[str] = None,
+        event_type: Optional[EventType] = None,
     ) -> List[ConnectionInfo]:
-        """Get connections subscribed to specific scope."""
+        """Get connections subscribed to specific scope and event type."""
         subscription_key = (scope, scope_id)
+        global_key = (SubscriptionScope.GLOBAL, None)
         connection_ids = self.subscription_index.get(subscription_key, set())
 
         # Also include global subscribers
         if scope != SubscriptionScope.GLOBAL:
-            global_key = (SubscriptionScope.GLOBAL, None)
-            connection_ids.update(self.subscription_index.get(global_key, set()))
+            connection_ids = connection_ids | self.subscription_index.get(
+                global_key, set()
+            )
+
+        # Drop connections that did not ask for this event type
+        if event_type is not None and connection_ids:
+            connection_ids = connection_ids & (
+                self.event_type_index.get(event_type, set())
+                | self.event_type_index.get(None, set())
+            )
 
-        return [
-            self.connections[conn_id]
-            for conn_id in connection_ids
-            if conn_id in self.connections
-        ]
+        connections, dangling = self._resolve(connection_ids)
+        if dangling:
+            self._purge_dangling(
+                dangling, subscription_keys=(subscription_key, global_key)
+            )
+        return connections
+
+    def has_subscribers(
+        self,
+        scope: SubscriptionScope,
+        scope_id: Optional[str] = None,
+        event_type: Optional[EventType] = None,
+    ) -> bool:
+        """Check whether an event could reach anyone, using only the indexes.
+
+        Ids of connections that have already gone away may still count, so a
+        True result can be stale; get_subscribers() is authoritative.
+        """
+        candidates = [self.subscription_index.get((scope, scope_id))]
+        if scope != SubscriptionScope.GLOBAL:
+            candidates.append(
+                self.subscription_index.get((SubscriptionScope.GLOBAL, None))
+            )
+        if event_type is None:
+            return any(candidates)
+
+        typed = self.event_type_index.get(event_type)
+        untyped = self.event_type_index.get(None)
+        for connection_ids in candidates:
+            if not connection_ids:
+                continue
+            if typed and not connection_ids.isdisjoint(typed):
+                return True
+            if untyped and not connection_ids.isdisjoint(untyped):
+                return True
+        return False
+
+    def _resolve(
+        self, connection_ids: Set[str]
+    ) -> Tuple[List[ConnectionInfo], List[str]]:
+        """Map ids to live connections, also returning ids with no owner."""
+        connections = []
+        dangling = []
+        for conn_id in connection_ids:
+            connection_info = self.connections.get(conn_id)
+            if connection_info is None:
+                dangling.append(conn_id)
+            else:
+                connections.append(connection_info)
+        return connections, dangling
+
+    def _purge_dangling(
+        self,
+        connection_ids: List[str],
+        user_id: Optional[str] = None,
+        subscription_keys: Tuple[Tuple[SubscriptionScope, Optional[str]], ...] = (),
+    ) -> None:
+        """Drop ids of connections that are no longer registered."""
+        for conn_id in connection_ids:
+            if user_id is not None and user_id in self.user_connections:
+                self.user_connections[user_id].discard(conn_id)
+                if not self.user_connections[user_id]:
+                    del self.user_connections[user_id]
+
+            for key in subscription_keys:
+                if key in self.subscription_index:
+                    self.subscription_index[key].discard(conn_id)
+                    if not self.subscription_index[key]:
+                        del self.subscription_index[key]
+
+            for event_type in self._connection_event_types.pop(conn_id, ()):
+                self.event_type_index[event_type].discard(conn_id)
+                if not self.event_type_index[event_type]:
+                    del self.event_type_index[event_type]
+
+        logger.debug(f"Purged {len(connection_ids)} dangling connection ids")
 
     def update_activity(self, connection_id: str) -> None:
         """Update last activity time for connection."""
-        if connection_id in self.connections:
-            self.connections[connection_id].last_activity = datetime.utcnow()
-            self.connections[connection_id].message_count += 1
+        connection_info = self.connections.get(connection_id)
+        if connection_info is not None:
+            connection_info.last_activity = time.monotonic()
+            connection_info.message_count += 1
+
+    def mark_stale(self, connection_id: str) -> None:
+        """Flag a connection for removal on the next cleanup pass."""
+        connection_info = self.connections.get(connection_id)
+        if connection_info is not None:
+            connection_info.last_activity = 0.0
+            heapq.heappush(self._expiry_heap, (0.0, connection_id))
 
     def get_connection_stats(self) -> Dict[str, Any]:
         """Get connection statistics."""
@@ -356,25 +622,32 @@ class ConnectionRegistry:
                     except Exception as e:
                         logger.error(f"Error in connection cleanup: {str(e)}")
 
-            self._cleanup_task = asyncio.create_task(cleanup_connections())
+            self._cleanup_task = _spawn(cleanup_connections())
         except RuntimeError:
             # No running event loop, skip starting cleanup task
             self._cleanup_task = None
 
     async def _cleanup_stale_connections(self) -> None:
-        """Clean up stale or disconnected connections."""
-        cutoff_time = datetime.utcnow() - timedelta(minutes=30)
+        """Clean up stale connections.
+
+        Disconnected sockets are removed by the connection handler itself, so
+        only connections whose expiry entry crossed the cutoff are inspected.
+        """
+        cutoff_time = time.monotonic() - STALE_CONNECTION_SECONDS
         stale_connections = []
+        heap = self._expiry_heap
 
-        for connection_id, connection_info in self.connections.items():
-            # Check if connection is stale
-            if connection_info.last_activity < cutoff_time:
-                stale_connections.append(connection_id)
+        while heap and heap[0][0] < cutoff_time:
+            _, connection_id = heapq.heappop(heap)
+            connection_info = self.connections.get(connection_id)
+            if connection_info is None:
                 continue
 
-            # Check if WebSocket is still connected
-            if connection_info.websocket.client_state == WebSocketState.DISCONNECTED:
+            if connection_info.last_activity < cutoff_time:
                 stale_connections.append(connection_id)
+            else:
+                # Active since the entry was pushed; re-arm with latest time
+                heapq.heappush(heap, (connection_info.last_activity, connection_id))
 
         # Remove stale connections
         for connection_id in stale_connections:
@@ -384,63 +657,156 @@ class ConnectionRegistry:
             logger.info(f"Cleaned up {len(stale_connections)} stale connections")
 
 
+# High-frequency events where only the latest value per entity matters,
+# mapped to the data key naming that entity
+COALESCABLE_EVENTS: Dict[EventType, str] = {
+    EventType.AGENT_EXECUTION_PROGRESS: "agent_id",
+    EventType.TEAM_EXECUTION_PROGRESS: "team_id",
+    EventType.WORKFLOW_EXECUTION_PROGRESS: "workflow_id",
+}
+
+# Queue depth above which LOW priority messages are dropped
+BACKPRESSURE_THRESHOLD = 512
+
+# (event_type, scope, scope_id, entity_id) identifying a coalescable value
+_CoalesceKey = Tuple[EventType, SubscriptionScope, Optional[str], Any]
+
+
+def _coalesce_key(message: WebSocketMessage) -> Optional[_CoalesceKey]:
+    """Key under which a message replaces an older queued one, if any."""
+    entity_key = COALESCABLE_EVENTS.get(message.event_type)
+    if entity_key is None:
+        return None
+
+    entity_id = message.data.get(entity_key)
+    if entity_id is None and message.scope_id is None:
+        # Nothing tells progress of different entities apart
+        return None
+    return (message.event_type, message.scope, message.scope_id, entity_id)
+
+
+@dataclass(slots=True)
+class _QueueSlot:
+    """Queued message holder that can be overwritten in place."""
+
+    message: WebSocketMessage
+    key: Optional[_CoalesceKey]
+
+
 class MessageQueue:
     """Queue for reliable message delivery."""
 
-    def __init__(self, max_size: int = 10000):
+    def __init__(
+        self,
+        max_size: int = 1024,
+        backpressure_threshold: int = BACKPRESSURE_THRESHOLD,
+    ):
         """Initialize message queue."""
         self.max_size = max_size
+        self.backpressure_threshold = backpressure_threshold
         self.queues: Dict[str, asyncio.Queue] = {}  # connection_id -> queue
         self.pending_messages: Dict[str, List[WebSocketMessage]] = defaultdict(list)
+        # connection_id -> coalesce key -> newest queued slot
+        self.latest_by_key: Dict[str, Dict[_CoalesceKey, _QueueSlot]] = {}
 
     async def enqueue_message(
         self, connection_id: str, message: WebSocketMessage
     ) -> bool:
         """Enqueue message for connection."""
-        try:
-            if connection_id not in self.queues:
-                self.queues[connection_id] = asyncio.Queue(maxsize=self.max_size)
-
-            queue = self.queues[connection_id]
-
-            # Handle queue full scenarios based on priority
-            if queue.full():
-                if message.priority in [MessagePriority.HIGH, MessagePriority.CRITICAL]:
-                    # Remove lowest priority message to make room
-                    try:
-                        await asyncio.wait_for(queue.get_nowait(), timeout=0.1)
-                    except BaseException:
-                        pass
-                else:
-                    logger.warning(
-                        f"Message queue full for connection {connection_id}, dropping message"
-                    )
-                    return False
-
-            await queue.put(message)
-            return True
-
-        except Exception as e:
-            logger.error(f"Failed to enqueue message for {connection_id}: {str(e)}")
+        return self.put_message(connection_id, message)
+
+    def put_message(self, connection_id: str, message: WebSocketMessage) -> bool:
+        """Enqueue message for connection without suspending.
+
+        The connection's long-lived sender task does the actual writes, so
+        callers never allocate a Task or wait per delivery.
+        """
+        queue = self._get_queue(connection_id)
+        latest = self.latest_by_key.setdefault(connection_id, {})
+
+        # Latest value wins for progress events of the same entity
+        key = _coalesce_key(message)
+        if key is not None:
+            slot = latest.get(key)
+            if slot is not None:
+                slot.message = message
+                return True
+
+        # A client that has fallen behind stops receiving LOW priority traffic
+        if (
+            message.priority == MessagePriority.LOW
+            and queue.qsize() >= self.backpressure_threshold
+        ):
+            logger.debug(
+                f"Connection {connection_id} is behind, dropping low priority message"
+            )
             return False
 
-    async def dequeue_message(
-        self, connection_id: str, timeout: float = 1.0
-    ) -> Optional[WebSocketMessage]:
-        """Dequeue message for connection."""
+        slot = _QueueSlot(message=message, key=key)
         try:
-            if connection_id not in self.queues:
-                return None
+            queue.put_nowait(slot)
+        except asyncio.QueueFull:
+            # Handle queue full scenarios based on priority
+            if message.priority not in (
+                MessagePriority.HIGH,
+                MessagePriority.CRITICAL,
+            ):
+                logger.warning(
+                    f"Message queue full for connection {connection_id}, dropping message"
+                )
+                return False
+
+            # Evict the oldest queued message to make room
+            try:
+                evicted = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+            else:
+                if evicted.key is not None and latest.get(evicted.key) is evicted:
+                    del latest[evicted.key]
+            queue.put_nowait(slot)
 
-            queue = self.queues[connection_id]
-            message = await asyncio.wait_for(queue.get(), timeout=timeout)
-            return message
+        if key is not None:
+            latest[key] = slot
+        return True
 
-        except asyncio.TimeoutError:
-            return None
-        except Exception as e:
-            logger.error(f"Failed to dequeue message for {connection_id}: {str(e)}")
-            return None
+    def _get_queue(self, connection_id: str) -> asyncio.Queue:
+        """Get or create the queue for a connection."""
+        queue = self.queues.get(connection_id)
+        if queue is None:
+            queue = self.queues[connection_id] = asyncio.Queue(maxsize=self.max_size)
+        return queue
+
+    async def dequeue_message(self, connection_id: str) -> WebSocketMessage:
+        """Wait for the next message for connection.
+
+        Blocks without polling until a message arrives; callers stop waiting
+        by cancelling the awaiting task.
+        """
+        slot = await self._get_queue(connection_id).get()
+
+        latest = self.latest_by_key.get(connection_id)
+        if latest is not None and latest.get(slot.key) is slot:
+            del latest[slot.key]
+        return slot.message
+
+    def drain_nowait(self, connection_id: str, limit: int) -> List[WebSocketMessage]:
+        """Take up to ``limit`` already queued messages without waiting."""
+        queue = self.queues.get(connection_id)
+        if queue is None:
+            return []
+
+        latest = self.latest_by_key.get(connection_id, {})
+        messages = []
+        while len(messages) < limit:
+            try:
+                slot = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if latest.get(slot.key) is slot:
+                del latest[slot.key]
+            messages.append(slot.message)
+        return messages
 
     def get_queue_size(self, connection_id: str) -> int:
         """Get queue size for connection."""
@@ -454,23 +820,36 @@ class MessageQueue:
             del self.queues[connection_id]
         if connection_id in self.pending_messages:
             del self.pending_messages[connection_id]
+        self.latest_by_key.pop(connection_id, None)
 
 
 class EventBroadcaster:
     """Event broadcasting system for WebSocket messages."""
 
     def __init__(
-        self, connection_registry: ConnectionRegistry, message_queue: MessageQueue
+        self,
+        connection_registry: ConnectionRegistry,
+        message_queue: MessageQueue,
+        batch_frames: bool = False,
     ):
-        """Initialize event broadcaster."""
+        """Initialize event broadcaster.
+
+        With ``batch_frames`` enabled every delivery goes through the
+        per-connection queues, and events that pile up during a burst are
+        sent as a single ``{"type": "batch", "events": [...]}`` frame.
+        """
         self.connection_registry = connection_registry
         self.message_queue = message_queue
+        self.batch_frames = batch_frames
+        # Awaited with the id of each connection whose send failed
+        self.dead_connection_handler: Optional[Callable] = None
         self.event_filters: Dict[EventType, List[Callable]] = defaultdict(list)
         self.broadcast_stats = {
             "total_broadcasts": 0,
             "successful_deliveries": 0,
             "failed_deliveries": 0,
             "filtered_messages": 0,
+            "no_subscribers": 0,
         }
 
     async def broadcast_event(
@@ -486,6 +865,21 @@ class EventBroadcaster:
         self.broadcast_stats["total_broadcasts"] += 1
 
         try:
+            # Get target connections
+            if target_user_id:
+                target_connections = self.connection_registry.get_user_connections(
+                    target_user_id
+                )
+            else:
+                target_connections = self.connection_registry.get_subscribers(
+                    scope, scope_id, event_type
+                )
+
+            # Nobody is listening; skip building and filtering the message
+            if not target_connections:
+                self.broadcast_stats["no_subscribers"] += 1
+                return 0
+
             # Create message
             message = WebSocketMessage(
                 event_type=event_type,
@@ -500,62 +894,116 @@ class EventBroadcaster:
                 self.broadcast_stats["filtered_messages"] += 1
                 return 0
 
-            # Get target connections
-            if target_user_id:
-                target_connections = self.connection_registry.get_user_connections(
-                    target_user_id
-                )
+            if target_user_id or self.batch_frames:
+                # Queued deliveries go through the per-connection queue
+                delivery_count = 0
+                for connection_info in target_connections:
+                    success = self._send_message_to_connection(connection_info, message)
+                    if success:
+                        delivery_count += 1
+                        self.broadcast_stats["successful_deliveries"] += 1
+                    else:
+                        self.broadcast_stats["failed_deliveries"] += 1
             else:
-                target_connections = self.connection_registry.get_subscribers(
-                    scope, scope_id
-                )
-
-            # Broadcast to connections
-            delivery_count = 0
-            for connection_info in target_connections:
-                success = await self._send_message_to_connection(
-                    connection_info, message
-                )
-                if success:
-                    delivery_count += 1
-                    self.broadcast_stats["successful_deliveries"] += 1
-                else:
-                    self.broadcast_stats["failed_deliveries"] += 1
+                delivery_count = await self._fan_out(target_connections, message)
 
             logger.debug(
-                f"Broadcasted {event_type.value} to {delivery_count} connections"
+                f"Broadcasted {_EVENT_TYPE_VALUE[event_type]} to {delivery_count} connections"
             )
             return delivery_count
 
-        except Exception as e:
+        except (TypeError, ValueError) as e:
+            # Event data that cannot be encoded as JSON
             logger.error(f"Failed to broadcast event {event_type.value}: {str(e)}")
             self.broadcast_stats["failed_deliveries"] += 1
             return 0
 
-    async def _send_message_to_connection(
+    @staticmethod
+    def _serialize(message: WebSocketMessage) -> str:
+        """Serialize message once for all recipients of a broadcast."""
+        return _serialize_message(message)
+
+    async def _fan_out(
+        self, target_connections: List[ConnectionInfo], message: WebSocketMessage
+    ) -> int:
+        """Send one shared payload directly to every target connection."""
+        if not target_connections:
+            return 0
+
+        # One ASGI send event shared by every socket; send_text would build
+        # an identical dict per connection
+        send_event = {"type": "websocket.send", "text": self._serialize(message)}
+        delivery_count = 0
+        dead_connections: List[str] = []
+
+        # Send in bounded chunks so a large fan-out does not flood the loop
+        # with tasks and other connections get serviced between chunks
+        for start in range(0, len(target_connections), FANOUT_CHUNK_SIZE):
+            chunk = target_connections[start : start + FANOUT_CHUNK_SIZE]
+            if len(chunk) == 1:
+                # A lone recipient needs no Task; await the send inline
+                try:
+                    await self._safe_send(chunk[0].websocket, send_event)
+                    results = [None]
+                except Exception as e:
+                    results = [e]
+            else:
+                results = await asyncio.gather(
+                    *(
+                        self._safe_send(connection_info.websocket, send_event)
+                        for connection_info in chunk
+                    ),
+                    return_exceptions=True,
+                )
+
+            for connection_info, result in zip(chunk, results):
+                if isinstance(result, BaseException):
+                    logger.error(
+                        f"Failed to send message to connection {connection_info.connection_id}: {result!r}"
+                    )
+                    self.broadcast_stats["failed_deliveries"] += 1
+                    dead_connections.append(connection_info.connection_id)
+                else:
+                    self.connection_registry.update_activity(
+                        connection_info.connection_id
+                    )
+                    self.broadcast_stats["successful_deliveries"] += 1
+                    delivery_count += 1
+
+        # Tear down failed connections together once the broadcast is done
+        if dead_connections:
+            if self.dead_connection_handler is not None:
+                await asyncio.gather(
+                    *(self.dead_connection_handler(cid) for cid in dead_connections),
+                    return_exceptions=True,
+                )
+            else:
+                for connection_id in dead_connections:
+                    self.connection_registry.mark_stale(connection_id)
+
+        return delivery_count
+
+    @staticmethod
+    async def _safe_send(websocket: WebSocket, send_event: Dict[str, Any]) -> None:
+        """Send to one socket, giving up after SEND_TIMEOUT_SECONDS."""
+        async with asyncio.timeout(SEND_TIMEOUT_SECONDS):
+            await websocket.send(send_event)
+
+    def _send_message_to_connection(
         self, connection_info: ConnectionInfo, message: WebSocketMessage
     ) -> bool:
-        """Send message to specific connection."""
-        try:
-            # Add connection-specific metadata
-            message.user_id = connection_info.user_id
-            message.session_id = connection_info.session_id
-
-            # Enqueue message
-            success = await self.message_queue.enqueue_message(
-                connection_info.connection_id, message
-            )
-            if success:
-                # Update connection activity
-                self.connection_registry.update_activity(connection_info.connection_id)
+        """Queue message for a specific connection's sender task."""
+        # Add connection-specific metadata
+        message.user_id = connection_info.user_id
+        message.session_id = connection_info.session_id
 
-            return success
+        # Enqueue message
+        success = self.message_queue.put_message(connection_info.connection_id, message)
+        if success:
+            # Update connection activity
+            self.connection_registry.update_activity(connection_info.connection_id)
 
-        except Exception as e:
-            logger.error(
-                f"Failed to send message to connection {connection_info.connection_id}: {str(e)}"
-            )
-            return False
+        return success
 
     async def _apply_event_filters(self, message: WebSocketMessage) -> bool:
         """Apply event filters to message."""
@@ -585,20 +1033,34 @@ class EventBroadcaster:
 class WebSocketManager:
     """Main WebSocket management class."""
 
-    def __init__(self):
+    def __init__(self, batch_frames: bool = False):
         """Initialize WebSocket manager."""
         self.connection_registry = ConnectionRegistry()
         self.message_queue = MessageQueue()
         self.event_broadcaster = EventBroadcaster(
-            self.connection_registry, self.message_queue
+            self.connection_registry, self.message_queue, batch_frames
         )
+        self.event_broadcaster.dead_connection_handler = self.disconnect_websocket
         self.connection_handlers: Dict[str, asyncio.Task] = {}
         self.auth_handler: Optional[Callable] = None
 
+        # Incoming message type -> handler(connection_info, data)
+        self._inbound_handlers: Dict[str, Callable] = {
+            "subscribe": self._handle_subscription,
+            "unsubscribe": self._handle_unsubscription,
+            "ping": self._handle_ping,
+            "authenticate": self._handle_authentication,
+        }
+
         # Rate limiting
-        self.rate_limits: Dict[str, List[datetime]] = defaultdict(list)
         self.rate_limit_window = 60  # seconds
         self.rate_limit_max = 100  # messages per window
+        # connection_id -> (tokens, last refill time.monotonic()) token bucket
+        self.rate_limits: Dict[str, Tuple[float, float]] = {}
+        self._rate_limit_sweep_task: Optional[asyncio.Task] = None
+
+        # (expires_at, stats) snapshot shared by monitoring scrapes
+        self._stats_cache: Optional[Tuple[float, Dict[str, Any]]] = None
 
     def set_auth_handler(self, auth_handler: Callable) -> None:
         """Set authentication handler."""
@@ -641,8 +1103,12 @@ class WebSocketManager:
         # Add to registry
         self.connection_registry.add_connection(connection_info)
 
+        # Started on first connect; the manager is built before any loop runs
+        if self._rate_limit_sweep_task is None:
+            self._rate_limit_sweep_task = _spawn(self._sweep_rate_limits())
+
         # Start connection handlers
-        self.connection_handlers[connection_id] = asyncio.create_task(
+        self.connection_handlers[connection_id] = _spawn(
             self._handle_connection(connection_info)
         )
 
@@ -677,7 +1143,7 @@ class WebSocketManager:
 
         try:
             # Start message sender task
-            sender_task = asyncio.create_task(self._message_sender(connection_info))
+            sender_task = _spawn(self._message_sender(connection_info))
 
             # Handle incoming messages
             async for message in websocket.iter_text():
@@ -685,7 +1151,7 @@ class WebSocketManager:
                     # Rate limiting check
                     if not self._check_rate_limit(connection_id):
                         await websocket.send_text(
-                            json.dumps(
+                            _json_dumps(
                                 {
                                     "error": "Rate limit exceeded",
                                     "message": f"Maximum {self.rate_limit_max} messages per {self.rate_limit_window} seconds",
@@ -698,16 +1164,12 @@ class WebSocketManager:
                     await self._process_incoming_message(connection_info, message)
 
                 except json.JSONDecodeError:
-                    await websocket.send_text(
-                        json.dumps({"error": "Invalid JSON format"})
-                    )
+                    await websocket.send_text(_ERR_INVALID_JSON)
                 except Exception as e:
                     logger.error(
                         f"Error processing message from {connection_id}: {str(e)}"
                     )
-                    await websocket.send_text(
-                        json.dumps({"error": "Internal server error"})
-                    )
+                    await websocket.send_text(_ERR_INTERNAL)
 
         except WebSocketDisconnect:
             logger.info(f"WebSocket disconnected: {connection_id}")
@@ -728,35 +1190,36 @@ class WebSocketManager:
 
         try:
             while True:
-                # Get message from queue
-                message = await self.message_queue.dequeue_message(
-                    connection_id, timeout=1.0
-                )
+                # Wait for the next queued message
+                messages = [await self.message_queue.dequeue_message(connection_id)]
 
-                if message is None:
-                    continue
+                # Fold whatever else queued up meanwhile into one frame
+                if self.event_broadcaster.batch_frames:
+                    messages += self.message_queue.drain_nowait(
+                        connection_id, MAX_BATCH_EVENTS - 1
+                    )
+
+                if len(messages) == 1:
+                    payload = _serialize_message(messages[0])
+                else:
+                    payload = (
+                        '{"type":"batch","events":['
+                        + ",".join(map(_serialize_message, messages))
+                        + "]}"
+                    )
 
                 # Send message
                 try:
-                    message_data = {
-                        "id": message.id,
-                        "event_type": message.event_type.value,
-                        "data": message.data,
-                        "timestamp": message.timestamp.isoformat(),
-                        "scope": message.scope.value,
-                        "scope_id": message.scope_id,
-                        "metadata": message.metadata,
-                    }
-
-                    await websocket.send_text(json.dumps(message_data))
+                    await websocket.send_text(payload)
                     logger.debug(
-                        f"Sent message {message.id} to connection {connection_id}"
+                        f"Sent {len(messages)} message(s) to connection {connection_id}"
                     )
 
-                except Exception as e:
+                except _SEND_ERRORS as e:
                     logger.error(f"Failed to send message to {connection_id}: {str(e)}")
-                    # Re-queue message for retry
-                    await self.message_queue.enqueue_message(connection_id, message)
+                    # Re-queue messages for retry
+                    for message in messages:
+                        self.message_queue.put_message(connection_id, message)
                     break
 
         except asyncio.CancelledError:
@@ -769,45 +1232,55 @@ class WebSocketManager:
     ) -> None:
         """Process incoming WebSocket message."""
         try:
-            data = json.loads(message)
+            data = _json_loads(message)
             message_type = data.get("type")
 
-            if message_type == "subscribe":
-                await self._handle_subscription(connection_info, data)
-            elif message_type == "unsubscribe":
-                await self._handle_unsubscription(connection_info, data)
-            elif message_type == "ping":
-                await self._handle_ping(connection_info)
-            elif message_type == "authenticate":
-                await self._handle_authentication(connection_info, data)
+            handler = self._inbound_handlers.get(message_type)
+            if handler is not None:
+                await handler(connection_info, data)
             else:
                 logger.warning(f"Unknown message type: {message_type}")
                 await connection_info.websocket.send_text(
-                    json.dumps({"error": f"Unknown message type: {message_type}"})
+                    _json_dumps({"error": f"Unknown message type: {message_type}"})
                 )
 
         except Exception as e:
             logger.error(f"Error processing incoming message: {str(e)}")
-            await connection_info.websocket.send_text(
-                json.dumps({"error": "Failed to process message"})
-            )
+            await connection_info.websocket.send_text(_ERR_PROCESS_FAILED)
 
     async def _handle_subscription(
         self, connection_info: ConnectionInfo, data: Dict[str, Any]
     ) -> None:
         """Handle subscription request."""
         try:
-            scope = SubscriptionScope(data.get("scope", "global"))
+            scope_value = data.get("scope", "global")
+            scope = _SCOPE_BY_VALUE.get(scope_value)
+            if scope is None:
+                await connection_info.websocket.send_text(
+                    _json_dumps(
+                        {"error": "Unknown subscription scope", "scope": scope_value}
+                    )
+                )
+                return
+
             scope_id = data.get("scope_id")
             event_types = data.get("event_types", [])
 
+            try:
+                subscribed_types = {_EVENT_BY_VALUE[et] for et in event_types}
+            except KeyError as e:
+                await connection_info.websocket.send_text(
+                    _json_dumps(
+                        {"error": "Unknown event type", "event_type": e.args[0]}
+                    )
+                )
+                return
+
             # Create subscription
             subscription = EventSubscription(
                 scope=scope,
                 scope_id=scope_id,
-                event_types=set(EventType(et) for et in event_types)
-                if event_types
-                else set(),
+                event_types=subscribed_types,
             )
 
             # Add subscription to connection
@@ -817,7 +1290,7 @@ class WebSocketManager:
 
             if success:
                 await connection_info.websocket.send_text(
-                    json.dumps(
+                    _json_dumps(
                         {
                             "type": "subscription_confirmed",
                             "scope": scope.value,
@@ -827,22 +1300,27 @@ class WebSocketManager:
                     )
                 )
             else:
-                await connection_info.websocket.send_text(
-                    json.dumps({"error": "Failed to add subscription"})
-                )
+                await connection_info.websocket.send_text(_ERR_SUBSCRIBE_FAILED)
 
         except Exception as e:
             logger.error(f"Error handling subscription: {str(e)}")
-            await connection_info.websocket.send_text(
-                json.dumps({"error": "Invalid subscription request"})
-            )
+            await connection_info.websocket.send_text(_ERR_INVALID_SUBSCRIPTION)
 
     async def _handle_unsubscription(
         self, connection_info: ConnectionInfo, data: Dict[str, Any]
     ) -> None:
         """Handle unsubscription request."""
         try:
-            scope = SubscriptionScope(data.get("scope", "global"))
+            scope_value = data.get("scope", "global")
+            scope = _SCOPE_BY_VALUE.get(scope_value)
+            if scope is None:
+                await connection_info.websocket.send_text(
+                    _json_dumps(
+                        {"error": "Unknown subscription scope", "scope": scope_value}
+                    )
+                )
+                return
+
             scope_id = data.get("scope_id")
 
             # Remove subscription
@@ -852,7 +1330,7 @@ class WebSocketManager:
 
             if success:
                 await connection_info.websocket.send_text(
-                    json.dumps(
+                    _json_dumps(
                         {
                             "type": "unsubscription_confirmed",
                             "scope": scope.value,
@@ -861,20 +1339,18 @@ class WebSocketManager:
                     )
                 )
             else:
-                await connection_info.websocket.send_text(
-                    json.dumps({"error": "Failed to remove subscription"})
-                )
+                await connection_info.websocket.send_text(_ERR_UNSUBSCRIBE_FAILED)
 
         except Exception as e:
             logger.error(f"Error handling unsubscription: {str(e)}")
-            await connection_info.websocket.send_text(
-                json.dumps({"error": "Invalid unsubscription request"})
-            )
+            await connection_info.websocket.send_text(_ERR_INVALID_UNSUBSCRIPTION)
 
-    async def _handle_ping(self, connection_info: ConnectionInfo) -> None:
+    async def _handle_ping(
+        self, connection_info: ConnectionInfo, data: Dict[str, Any]
+    ) -> None:
         """Handle ping message."""
         await connection_info.websocket.send_text(
-            json.dumps({"type": "pong", "timestamp": datetime.utcnow().isoformat()})
+            '{"type":"pong","timestamp":"' + _utcnow_iso() + '"}'
         )
 
     async def _handle_authentication(
@@ -882,9 +1358,7 @@ class WebSocketManager:
     ) -> None:
         """Handle authentication message."""
         if not self.auth_handler:
-            await connection_info.websocket.send_text(
-                json.dumps({"error": "Authentication not supported"})
-            )
+            await connection_info.websocket.send_text(_ERR_AUTH_UNSUPPORTED)
             return
 
         try:
@@ -900,7 +1374,7 @@ class WebSocketManager:
             connection_info.is_authenticated = True
 
             await connection_info.websocket.send_text(
-                json.dumps(
+                _json_dumps(
                     {
                         "type": "authentication_success",
                         "user_id": connection_info.user_id,
@@ -911,30 +1385,47 @@ class WebSocketManager:
 
         except Exception as e:
             logger.warning(f"Authentication failed: {str(e)}")
-            await connection_info.websocket.send_text(
-                json.dumps({"error": "Authentication failed"})
-            )
+            await connection_info.websocket.send_text(_ERR_AUTH_FAILED)
 
     def _check_rate_limit(self, connection_id: str) -> bool:
         """Check rate limiting for connection."""
-        now = datetime.utcnow()
-        cutoff = now - timedelta(seconds=self.rate_limit_window)
-
-        # Clean old entries
-        self.rate_limits[connection_id] = [
-            timestamp
-            for timestamp in self.rate_limits[connection_id]
-            if timestamp > cutoff
-        ]
+        now = time.monotonic()
+        bucket = self.rate_limits.get(connection_id)
+
+        # Refill at rate_limit_max tokens per window, capped at a full bucket
+        if bucket is None:
+            tokens = float(self.rate_limit_max)
+        else:
+            tokens, last_refill = bucket
+            tokens = min(
+                self.rate_limit_max,
+                tokens
+                + (now - last_refill) * self.rate_limit_max / self.rate_limit_window,
+            )
 
         # Check if under limit
-        if len(self.rate_limits[connection_id]) >= self.rate_limit_max:
+        if tokens < 1:
+            self.rate_limits[connection_id] = (tokens, now)
             return False
 
-        # Add current request
-        self.rate_limits[connection_id].append(now)
+        self.rate_limits[connection_id] = (tokens - 1, now)
         return True
 
+    async def _sweep_rate_limits(self) -> None:
+        """Drop token buckets that have been idle for a full window.
+
+        Such a bucket has refilled completely, and _check_rate_limit treats a
+        missing bucket as full, so removing it changes nothing but memory.
+        """
+        while True:
+            await asyncio.sleep(self.rate_limit_window)
+            cutoff = time.monotonic() - self.rate_limit_window
+            self.rate_limits = {
+                connection_id: bucket
+                for connection_id, bucket in self.rate_limits.items()
+                if bucket[1] > cutoff
+            }
+
     # Public API methods
 
     async def broadcast_event(
@@ -951,21 +1442,41 @@ class WebSocketManager:
             event_type, data, scope, scope_id, priority, target_user_id
         )
 
+    def has_subscribers(
+        self,
+        event_type: EventType,
+        scope: SubscriptionScope = SubscriptionScope.GLOBAL,
+        scope_id: Optional[str] = None,
+    ) -> bool:
+        """Check whether a broadcast could reach anyone before building it."""
+        return self.connection_registry.has_subscribers(scope, scope_id, event_type)
+
     def add_event_filter(self, event_type: EventType, filter_func: Callable) -> None:
         """Add event filter."""
         self.event_broadcaster.add_event_filter(event_type, filter_func)
 
     def get_connection_stats(self) -> Dict[str, Any]:
-        """Get connection statistics."""
+        """Get connection statistics.
+
+        Registry stats walk every connection, so a snapshot is reused for
+        STATS_CACHE_SECONDS; callers must not mutate the returned dict.
+        """
+        now = time.monotonic()
+        cached = self._stats_cache
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
         conn_stats = self.connection_registry.get_connection_stats()
         broadcast_stats = self.event_broadcaster.get_broadcast_stats()
 
-        return {
+        stats = {
             "connections": conn_stats,
             "broadcasting": broadcast_stats,
             "active_handlers": len(self.connection_handlers),
             "rate_limited_connections": len(self.rate_limits),
         }
+        self._stats_cache = (now + STATS_CACHE_SECONDS, stats)
+        return stats
 
     async def send_to_user(
         self,
@@ -1019,19 +1530,12 @@ async def websocket_endpoint(
             websocket, user_id, session_id, token
         )
 
-        # Wait for disconnection
-        while True:
-            await asyncio.sleep(1)
-
-            # Check if connection is still active
-            connection_info = websocket_manager.connection_registry.get_connection(
-                connection_id
-            )
-            if (
-                not connection_info
-                or connection_info.websocket.client_state == WebSocketState.DISCONNECTED
-            ):
-                break
+        # Wait for disconnection; the registry signals it on removal
+        connection_info = websocket_manager.connection_registry.get_connection(
+            connection_id
+        )
+        if connection_info is not None:
+            await connection_info.disconnect_event.wait()
 
     except WebSocketDisconnect:
         logger.info(f"WebSocket disconnected: {connection_id}")
@@ -1049,6 +1553,10 @@ async def broadcast_agent_status(
     agent_id: str, status: str, data: Optional[Dict[str, Any]] = None
 ):
     """Broadcast agent status change."""
+    if not websocket_manager.has_subscribers(
+        EventType.AGENT_STATUS_CHANGED, SubscriptionScope.AGENT, agent_id
+    ):
+        return
     await websocket_manager.broadcast_event(
         EventType.AGENT_STATUS_CHANGED,
         {"agent_id": agent_id, "status": status, "data": data or {}},
@@ -1061,10 +1569,17 @@ async def broadcast_workflow_progress(
     workflow_id: str, progress: float, data: Optional[Dict[str, Any]] = None
 ):
     """Broadcast workflow execution progress."""
-    await websocket_manager.broadcast_event(
+    event_type = (
         EventType.WORKFLOW_EXECUTION_PROGRESS
         if progress < 1.0
-        else EventType.WORKFLOW_EXECUTION_COMPLETED,
+        else EventType.WORKFLOW_EXECUTION_COMPLETED
+    )
+    if not websocket_manager.has_subscribers(
+        event_type, SubscriptionScope.WORKFLOW, workflow_id
+    ):
+        return
+    await websocket_manager.broadcast_event(
+        event_type,
         {"workflow_id": workflow_id, "progress": progress, "data": data or {}},
         scope=SubscriptionScope.WORKFLOW,
         scope_id=workflow_id,
@@ -1075,6 +1590,8 @@ async def broadcast_system_alert(
     level: str, message: str, data: Optional[Dict[str, Any]] = None
 ):
     """Broadcast system alert."""
+    if not websocket_manager.has_subscribers(EventType.SYSTEM_ALERT):
+        return
     await websocket_manager.broadcast_event(
         EventType.SYSTEM_ALERT,
         {"level": level, "message": message, "data": data or {}},
@@ -1088,23 +1605,31 @@ async def broadcast_log_entry(
     source: str, level: str, message: str, timestamp: Optional[datetime] = None
 ):
     """Broadcast log entry."""
+    if not websocket_manager.has_subscribers(EventType.SYSTEM_LOG_ENTRY):
+        return
     await websocket_manager.broadcast_event(
         EventType.SYSTEM_LOG_ENTRY,
         {
             "source": source,
             "level": level,
             "message": message,
-            "timestamp": (timestamp or datetime.utcnow()).isoformat(),
+            "timestamp": timestamp.isoformat() if timestamp else _utcnow_iso(),
         },
     )
 
 
 # Authentication helper (can be customized)
+@lru_cache(maxsize=4096)
+def _decode_unverified_token(token: str) -> Dict[str, Any]:
+    """Decode a token without verification; the result depends only on the token."""
+    return jwt.decode(token, options={"verify_signature": False})
+
+
 async def default_auth_handler(token: str) -> Dict[str, Any]:
     """Default authentication handler."""
     try:
         # This is a simple example - in production, use proper JWT validation
-        payload = jwt.decode(token, options={"verify_signature": False})
+        payload = _decode_unverified_token(token)
         return {
             "user_id": payload.get("user_id"),
             "session_id": payload.get("session_id"),
@@ -18,9 +18,12 @@ Architecture:
 - Database-backed user management
 - Configurable security policies
 """
+import hashlib
 import logging
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import jwt
 from fastapi import Depends, HTTPException, status
@@ -35,6 +38,11 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
 security = HTTPBearer()
 
+# Verified token payloads: token -> (monotonic deadline, payload), oldest first
+TOKEN_CACHE_SIZE = 4096
+TOKEN_CACHE_TTL_SECONDS = 300.0
+_token_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
 
 class AuthServiceError(Exception):
     """Base exception for authentication service errors."""
@@ -60,6 +68,42 @@ class InsufficientPermissionsError(AuthServiceError):
     pass
 
 
+def _decode_token(token: str) -> Dict[str, Any]:
+    """
+    Decode and verify a JWT, reusing the payload of recently seen tokens.
+
+    Entries expire with the token's own ``exp`` claim (capped at
+    ``TOKEN_CACHE_TTL_SECONDS``) so a cached token never outlives what
+    ``jwt.decode`` would have accepted.
+
+    Args:
+        token: Encoded JWT
+
+    Returns:
+        Decoded token payload
+    """
+    now = time.monotonic()
+    cached = _token_cache.get(token)
+    if cached is not None:
+        if cached[0] > now:
+            _token_cache.move_to_end(token)
+            return cached[1]
+        del _token_cache[token]
+
+    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+
+    ttl = TOKEN_CACHE_TTL_SECONDS
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        ttl = min(ttl, exp - time.time())
+    if ttl > 0:
+        _token_cache[token] = (now + ttl, payload)
+        if len(_token_cache) > TOKEN_CACHE_SIZE:
+            _token_cache.popitem(last=False)
+
+    return payload
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
 ) -> Dict[str, Any]:
@@ -80,7 +124,7 @@ async def get_current_user(
         token = credentials.credentials
 
         # Decode JWT token
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = _decode_token(token)
 
         # Extract user information
         user_id = payload.get("sub")
@@ -94,7 +138,7 @@ async def get_current_user(
             "email": payload.get("email", f"user_{user_id}@example.com"),
             "name": payload.get("name", f"User {user_id}"),
             "role": payload.get("role", "user"),
-            "permissions": payload.get("permissions", ["read"]),
+            "permissions": frozenset(payload.get("permissions", ("read",))),
             "created_at": datetime.utcnow(),
             "last_login": datetime.utcnow(),
         }
@@ -167,17 +211,21 @@ async def validate_user_permissions(
         True if user has permissions
     """
     try:
-        user_permissions = user.get("permissions", [])
         user_role = user.get("role", "user")
 
         # Admin role has all permissions
         if user_role == "admin":
             return True
 
+        # get_current_user stores permissions as a frozenset; other sources
+        # may still hand us a list
+        user_permissions = user.get("permissions", frozenset())
+        if not isinstance(user_permissions, frozenset):
+            user_permissions = frozenset(user_permissions)
+
         # Check if user has all required permissions
-        for permission in required_permissions:
-            if permission not in user_permissions:
-                return False
+        if not user_permissions.issuperset(required_permissions):
+            return False
 
         # TODO: Implement resource-specific permission checks
         # For now, return True if user has basic permissions
@@ -203,7 +251,9 @@ async def authenticate_user(username: str, password: str) -> Optional[Dict[str,
         # TODO: Implement actual user authentication against database
         # For now, return mock user data for testing
         if username and password:  # Basic validation
-            user_id = f"user_{hash(username) % 1000}"
+            # blake2b rather than hash(): str hashes are salted per process
+            digest = hashlib.blake2b(username.encode(), digest_size=2).digest()
+            user_id = f"user_{int.from_bytes(digest, 'little')}"
             return {
                 "id": user_id,
                 "email": username,
@@ -234,14 +284,15 @@ async def get_user_by_id(user_id: str) -> Optional[Dict[str, Any]]:
         # TODO: Implement actual user lookup from database
         # For now, return mock user data
         if user_id.startswith("user_"):
+            now = datetime.utcnow()
             return {
                 "id": user_id,
                 "email": f"{user_id}@example.com",
                 "name": f"User {user_id}",
                 "role": "user",
                 "permissions": ["read", "write"],
-                "created_at": datetime.utcnow(),
-                "last_login": datetime.utcnow(),
+                "created_at": now,
+                "last_login": now,
             }
         return None
 
@@ -23,12 +23,22 @@ Architecture:
 
 import asyncio
 import logging
+import time
 import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from pydantic import ValidationError
 
@@ -39,6 +49,12 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Short-lived project lookup cache shared by all service instances:
+# (project_id, user_id) -> (expires_at, project)
+PROJECT_CACHE_TTL_SECONDS = 5.0
+PROJECT_CACHE_MAX_SIZE = 2048
+_project_cache: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+
 
 class ProjectServiceError(Exception):
     """Base exception for project service errors."""
@@ -105,6 +121,7 @@ class ProjectService:
             # TODO: Implement actual project retrieval from database
             # For now, return a mock project for testing
             if project_id.startswith("project_"):
+                now = datetime.utcnow()
                 return {
                     "id": project_id,
                     "name": f"Project {project_id}",
@@ -116,14 +133,94 @@ class ProjectService:
                     "max_workflows": 25,
                     "max_tools": 100,
                     "max_books": 5,
-                    "created_at": datetime.utcnow(),
-                    "updated_at": datetime.utcnow(),
+                    "created_at": now,
+                    "updated_at": now,
                 }
             return None
         except Exception as e:
             self.logger.error(f"Error getting project {project_id}: {str(e)}")
             raise ProjectOperationError(f"Failed to get project: {str(e)}")
 
+    async def get_project_cached(
+        self, project_id: str, user_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a project by ID, serving repeat lookups from a short TTL cache.
+
+        Only found projects are cached, so a newly created project is never
+        hidden by a cached miss. Callers must not mutate the returned dict.
+
+        Args:
+            project_id: The project ID
+            user_id: The user ID for access control
+
+        Returns:
+            Project data or None if not found/not accessible
+        """
+        key = (project_id, user_id)
+        now = time.monotonic()
+        entry = _project_cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        project = await self.get_project(project_id, user_id)
+        if project is None:
+            _project_cache.pop(key, None)
+            return None
+
+        if key not in _project_cache and len(_project_cache) >= PROJECT_CACHE_MAX_SIZE:
+            # Evict the oldest entry
+            _project_cache.pop(next(iter(_project_cache)))
+        _project_cache[key] = (now + PROJECT_CACHE_TTL_SECONDS, project)
+        return project
+
+    def invalidate_project_cache(
+        self, project_id: str, user_id: Optional[str] = None
+    ) -> None:
+        """
+        Drop cached lookups for a project.
+
+        Args:
+            project_id: The project ID
+            user_id: Only drop this user's entry; all users if omitted
+        """
+        if user_id is not None:
+            _project_cache.pop((project_id, user_id), None)
+            return
+        for key in [key for key in _project_cache if key[0] == project_id]:
+            del _project_cache[key]
+
+    async def iter_projects(
+        self, user_id: str, skip: int = 0, limit: int = 50
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream projects accessible by a user without materializing the page.
+
+        Args:
+            user_id: The user ID
+            skip: Number of projects to skip
+            limit: Maximum number of projects to yield
+
+        Yields:
+            Project summaries
+        """
+        try:
+            # TODO: Implement actual project listing from database
+            # For now, yield mock projects for testing
+            for i in range(min(limit, 5)):  # Yield up to 5 mock projects
+                now = datetime.utcnow()
+                yield {
+                    "id": f"project_{i+1}",
+                    "name": f"Project {i+1}",
+                    "description": f"Mock project {i+1}",
+                    "owner_id": user_id,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+        except Exception as e:
+            self.logger.error(f"Error listing projects for user {user_id}: {str(e)}")
+            raise ProjectOperationError(f"Failed to list projects: {str(e)}")
+
     async def list_projects(
         self, user_id: str, skip: int = 0, limit: int = 50
     ) -> List[Dict[str, Any]]:
@@ -138,25 +235,10 @@ class ProjectService:
         Returns:
             List of project summaries
         """
-        try:
-            # TODO: Implement actual project listing from database
-            # For now, return mock projects for testing
-            projects = []
-            for i in range(min(limit, 5)):  # Return up to 5 mock projects
-                projects.append(
-                    {
-                        "id": f"project_{i+1}",
-                        "name": f"Project {i+1}",
-                        "description": f"Mock project {i+1}",
-                        "owner_id": user_id,
-                        "created_at": datetime.utcnow(),
-                        "updated_at": datetime.utcnow(),
-                    }
-                )
-            return projects
-        except Exception as e:
-            self.logger.error(f"Error listing projects for user {user_id}: {str(e)}")
-            raise ProjectOperationError(f"Failed to list projects: {str(e)}")
+        return [
+            project
+            async for project in self.iter_projects(user_id, skip=skip, limit=limit)
+        ]
 
     async def create_project(
         self,
@@ -227,6 +309,7 @@ class ProjectService:
                     project[key] = value
 
             project["updated_at"] = datetime.utcnow()
+            self.invalidate_project_cache(project_id)
             return project
         except ProjectNotFoundError:
             raise
@@ -252,6 +335,7 @@ class ProjectService:
                 raise ProjectNotFoundError(f"Project {project_id} not found")
 
             # TODO: Check if project has active resources before deletion
+            self.invalidate_project_cache(project_id)
             return True
         except ProjectNotFoundError:
             raise
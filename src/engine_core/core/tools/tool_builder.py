@@ -70,6 +70,7 @@ class ToolExecutionMode(Enum):
 
 class ToolStatus(Enum):
     """Tool availability status."""
+    PENDING = "pending"
     AVAILABLE = "available"
     UNAVAILABLE = "unavailable"
     MAINTENANCE = "maintenance"
@@ -15,10 +15,11 @@ import json
 import logging
 import uuid
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
 
 # Type checking imports
 if TYPE_CHECKING:
@@ -643,6 +644,9 @@ class WorkflowVertex:
 
 
 class WorkflowEngine:
+    """Pregel-style workflow engine."""
+
+    def __init__(self):
         """Initialize workflow engine."""
         self.vertices: Dict[str, WorkflowVertex] = {}
         self.edges: Dict[str, List[str]] = defaultdict(
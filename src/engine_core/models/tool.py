@@ -645,4 +645,5 @@ class Tool(SQLAlchemyBaseModel):
         )
 
 
-# Database indexes and constraints can be added later when SQLAlchemy setup is complete
+# Database indexes for performance
+Index("idx_tool_type_status", Tool.type, Tool.status)
@@ -41,7 +41,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
 
 from pydantic import Field, ValidationError
 
@@ -163,6 +163,19 @@ class AgentRepository(ABC):
         """Get agent by ID."""
         pass
 
+    async def get_by_ids(self, agent_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several agents by ID, keyed by ID; missing agents are omitted.
+
+        Database backends should override this with a single
+        ``WHERE id IN (...)`` query; the default issues the lookups concurrently.
+        """
+        agent_ids = list(agent_ids)
+        agents = await asyncio.gather(
+            *(self.get_by_id(agent_id) for agent_id in agent_ids)
+        )
+        return {agent_id: agent for agent_id, agent in zip(agent_ids, agents) if agent}
+
     @abstractmethod
     async def get_by_project_id(self, project_id: str) -> List[Dict[str, Any]]:
         """Get agents by project ID."""
@@ -211,6 +224,14 @@ class MockAgentRepository(AgentRepository):
         """Get agent by ID from mock storage."""
         return self._agents.get(agent_id)
 
+    async def get_by_ids(self, agent_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Get several agents by ID from mock storage."""
+        return {
+            agent_id: self._agents[agent_id]
+            for agent_id in agent_ids
+            if agent_id in self._agents
+        }
+
     async def get_by_project_id(self, project_id: str) -> List[Dict[str, Any]]:
         """Get agents by project ID from mock storage."""
         return [
@@ -356,6 +377,17 @@ class AgentService:
             logger.error(f"Failed to get agent {agent_id}: {str(e)}")
             raise AgentServiceError(f"Failed to get agent: {str(e)}")
 
+    async def get_agents_bulk(
+        self, agent_ids: Iterable[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get several agents in one repository call, keyed by ID."""
+        try:
+            return await self.repository.get_by_ids(agent_ids)
+
+        except Exception as e:
+            logger.error(f"Failed to get agents: {str(e)}")
+            raise AgentServiceError(f"Failed to get agents: {str(e)}")
+
     async def update_agent(
         self,
         agent_id: str,
@@ -25,13 +25,26 @@ import importlib
 import json
 import logging
 import os
+import sys
 import tempfile
 import uuid
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from pydantic import Field
 
@@ -75,41 +88,6 @@ if TYPE_CHECKING:
     from .agent_service import AgentService
     from .workflow_service import WorkflowService
 
-# Core imports
-from ..core.tools import (
-    APITool,
-    CLITool,
-    ExecutionEnvironment,
-    MCPTool,
-    PermissionLevel,
-    PluginTool,
-    ToolBuilder,
-    ToolCapability,
-    ToolConfiguration,
-    ToolExecutionMode,
-    ToolExecutionRequest,
-    ToolExecutionResult,
-    ToolHealthCheck,
-    ToolInterface,
-    ToolRegistry,
-    ToolStatus,
-    ToolType,
-)
-from ..core.tools.tool_executor import (
-    CacheManager,
-    ExecutionContext,
-    ExecutionMetrics,
-    ExecutionPriority,
-    ExecutionQueue,
-    ExecutionStatus,
-    ResourceLimits,
-    ResourceManager,
-    SecurityManager,
-    SecurityPolicy,
-    ToolExecutor,
-    create_tool_executor,
-)
-
 logger = logging.getLogger(__name__)
 
 
@@ -219,6 +197,19 @@ class ToolSearchCriteria:
     created_before: Optional[datetime] = None
     limit: int = 50
     offset: int = 0
+    cursor: Optional[str] = None  # Resume after this tool ID (keyset pagination)
+
+
+class ToolSummaryRow(NamedTuple):
+    """Projected tool columns needed for list views."""
+
+    id: str
+    name: str
+    description: Optional[str]
+    tool_type: str
+    status: str
+    created_at: datetime
+    command_count: int
 
 
 @dataclass
@@ -285,6 +276,47 @@ class ToolRepository(ABC):
         """Search tools by criteria."""
         pass
 
+    async def count_tools(self, criteria: ToolSearchCriteria) -> int:
+        """
+        Count tools matching criteria, ignoring limit, offset and cursor.
+
+        Default implementation falls back to an unpaginated search; concrete
+        repositories should override this with a COUNT query.
+        """
+        unpaginated = replace(criteria, limit=sys.maxsize, offset=0, cursor=None)
+        return len(await self.search_tools(unpaginated))
+
+    async def iter_tools(self, criteria: ToolSearchCriteria) -> AsyncIterator["Tool"]:
+        """
+        Iterate tools matching criteria one at a time.
+
+        Backends with server-side cursors should override this so rows are
+        streamed; the default falls back to a single search_tools() page.
+        """
+        for tool in await self.search_tools(criteria):
+            yield tool
+
+    async def iter_summaries(
+        self, criteria: ToolSearchCriteria
+    ) -> AsyncIterator[ToolSummaryRow]:
+        """
+        Iterate summary rows for tools matching criteria.
+
+        SQL backends should override this to select only the summary columns
+        and count commands server-side; the default projects full tools.
+        """
+        async for tool in self.iter_tools(criteria):
+            configuration = getattr(tool, "configuration", None) or {}
+            yield ToolSummaryRow(
+                id=str(tool.id),
+                name=getattr(tool, "name", "Unknown"),
+                description=getattr(tool, "description", None),
+                tool_type=getattr(tool, "tool_type", "unknown"),
+                status=getattr(tool, "status", "unknown"),
+                created_at=getattr(tool, "created_at", None) or datetime.utcnow(),
+                command_count=len(configuration.get("capabilities") or ()),
+            )
+
     @abstractmethod
     async def create_tool_execution(
         self, execution_data: Dict[str, Any]
@@ -396,11 +428,15 @@ class MockToolRepository(ToolRepository):
             return True
         return False
 
-    async def search_tools(self, criteria: ToolSearchCriteria) -> List["Tool"]:
-        """Search tools by criteria."""
-        results = []
+    def _iter_matching(self, criteria: ToolSearchCriteria) -> Iterator[Dict[str, Any]]:
+        """Yield stored tool records matching criteria, honouring the cursor."""
+        tools = iter(self.tools.items())
+        if criteria.cursor is not None:
+            for tool_id, _ in tools:
+                if tool_id == criteria.cursor:
+                    break
 
-        for tool_id, tool_data in self.tools.items():
+        for tool_id, tool_data in tools:
             # Apply filters
             if criteria.name_pattern and criteria.name_pattern not in tool_data.get(
                 "name", ""
@@ -418,6 +454,8 @@ class MockToolRepository(ToolRepository):
                 continue
             if criteria.user_id and tool_data.get("user_id") != criteria.user_id:
                 continue
+            if criteria.status and tool_data.get("status") != criteria.status.value:
+                continue
             if (
                 criteria.is_active is not None
                 and tool_data.get("is_active") != criteria.is_active
@@ -428,15 +466,57 @@ class MockToolRepository(ToolRepository):
                 if not set(criteria.tags).issubset(tool_tags):
                     continue
 
-            class MockTool:
-                def __init__(self, data):
-                    for key, value in data.items():
-                        setattr(self, key, value)
+            yield tool_data
+
+    async def search_tools(self, criteria: ToolSearchCriteria) -> List["Tool"]:
+        """Search tools by criteria."""
+
+        class MockTool:
+            def __init__(self, data):
+                for key, value in data.items():
+                    setattr(self, key, value)
 
-            results.append(MockTool(tool_data))
+        results = [MockTool(tool_data) for tool_data in self._iter_matching(criteria)]
 
         return results[criteria.offset : criteria.offset + criteria.limit]
 
+    async def count_tools(self, criteria: ToolSearchCriteria) -> int:
+        """Count tools matching criteria."""
+        return sum(1 for _ in self._iter_matching(replace(criteria, cursor=None)))
+
+    async def iter_tools(self, criteria: ToolSearchCriteria) -> AsyncIterator["Tool"]:
+        """Iterate tools matching criteria without building the full list."""
+
+        class MockTool:
+            def __init__(self, data):
+                for key, value in data.items():
+                    setattr(self, key, value)
+
+        matching = self._iter_matching(criteria)
+        for tool_data in islice(
+            matching, criteria.offset, criteria.offset + criteria.limit
+        ):
+            yield MockTool(tool_data)
+
+    async def iter_summaries(
+        self, criteria: ToolSearchCriteria
+    ) -> AsyncIterator[ToolSummaryRow]:
+        """Iterate summary rows straight from stored records."""
+        matching = self._iter_matching(criteria)
+        for tool_data in islice(
+            matching, criteria.offset, criteria.offset + criteria.limit
+        ):
+            configuration = tool_data.get("configuration") or {}
+            yield ToolSummaryRow(
+                id=str(tool_data["id"]),
+                name=tool_data.get("name", "Unknown"),
+                description=tool_data.get("description"),
+                tool_type=tool_data.get("tool_type", "unknown"),
+                status=tool_data.get("status", "unknown"),
+                created_at=tool_data.get("created_at") or datetime.utcnow(),
+                command_count=len(configuration.get("capabilities") or ()),
+            )
+
     async def create_tool_execution(
         self, execution_data: Dict[str, Any]
     ) -> "ToolExecution":
@@ -639,6 +719,8 @@ class ToolService:
         # Performance cache
         self._analytics_cache = {}
         self._tool_cache = {}
+        # Configurations of pending tools awaiting test_and_finalize_status
+        self._pending_configs: Dict[str, ToolConfiguration] = {}
         self._cache_ttl = 300  # 5 minutes
 
         # Service statistics
@@ -840,6 +922,34 @@ class ToolService:
             logger.error(f"Tool search failed: {str(e)}")
             raise ToolServiceError(str(e))
 
+    async def count_tools(self, criteria: ToolSearchCriteria) -> int:
+        """Count tools matching criteria, ignoring limit, offset and cursor."""
+        try:
+            return await self.repository.count_tools(criteria)
+        except Exception as e:
+            logger.error(f"Tool count failed: {str(e)}")
+            raise ToolServiceError(str(e))
+
+    async def iter_tools(self, criteria: ToolSearchCriteria) -> AsyncIterator["Tool"]:
+        """Stream tools matching criteria without materializing the result set."""
+        try:
+            async for tool in self.repository.iter_tools(criteria):
+                yield tool
+        except Exception as e:
+            logger.error(f"Tool iteration failed: {str(e)}")
+            raise ToolServiceError(str(e))
+
+    async def iter_summaries(
+        self, criteria: ToolSearchCriteria
+    ) -> AsyncIterator[ToolSummaryRow]:
+        """Stream projected summary rows for tools matching criteria."""
+        try:
+            async for row in self.repository.iter_summaries(criteria):
+                yield row
+        except Exception as e:
+            logger.error(f"Tool summary iteration failed: {str(e)}")
+            raise ToolServiceError(str(e))
+
     # === Tool Execution Operations ===
 
     async def execute_tool(self, request: ToolExecutionRequest) -> ToolExecutionResult:
@@ -949,6 +1059,70 @@ class ToolService:
             logger.error(f"Health check failed for tool {tool_id}: {str(e)}")
             raise ToolServiceError(str(e))
 
+    async def create_pending_tool(self, request: ToolCreateRequest) -> "Tool":
+        """
+        Persist a new tool record in the pending state.
+
+        The tool is not contacted here: its configuration is kept until
+        test_and_finalize_status registers it, which runs the connection
+        check, and replaces the pending status with the result.
+        """
+        config = await self._build_tool_configuration(request)
+
+        tool = await self.repository.create_tool(
+            {
+                "id": request.tool_id,
+                "name": request.name,
+                "tool_type": request.tool_type.value,
+                "version": request.version,
+                "description": request.description,
+                "configuration": config.__dict__,
+                "project_id": request.project_id,
+                "user_id": request.user_id,
+                "is_active": request.is_active,
+                "tags": request.tags,
+                "metadata": request.metadata,
+                "status": ToolStatus.PENDING.value,
+            }
+        )
+
+        self._pending_configs[request.tool_id] = config
+        return tool
+
+    async def test_and_finalize_status(self, tool_id: str) -> ToolStatus:
+        """
+        Run a connection health check and persist the resulting tool status.
+
+        Intended to run in the background after a tool is created so the
+        upstream round-trip stays off the request's critical path. Never
+        raises: any failure resolves to ToolStatus.ERROR.
+        """
+        try:
+            config = self._pending_configs.pop(tool_id, None)
+            if config is not None and self.tool_registry.get_tool(tool_id) is None:
+                # Registering initializes the tool, which opens its connection
+                if not await self.tool_registry.register_tool(config):
+                    raise ToolRegistrationError(f"Tool {tool_id} failed to initialize")
+                self.service_stats["total_tools_registered"] += 1
+
+            health_check = await self.health_check_tool(tool_id)
+            status = health_check.status
+        except Exception as e:
+            logger.error(f"Connection check failed for tool {tool_id}: {str(e)}")
+            status = ToolStatus.ERROR
+
+        try:
+            await self.repository.update_tool(tool_id, {"status": status.value})
+        except Exception as e:
+            logger.error(f"Failed to persist status for tool {tool_id}: {str(e)}")
+            status = ToolStatus.ERROR
+        finally:
+            # Drop any cached copy holding the pending status
+            self._tool_cache.pop(f"tool_{tool_id}", None)
+
+        logger.info(f"Tool {tool_id} connection check finished: {status.value}")
+        return status
+
     async def health_check_all_tools(self) -> Dict[str, ToolHealthCheck]:
         """Health check all registered tools."""
         try:
@@ -29,14 +29,30 @@ Dependencies:
 - Database models (Workflow, WorkflowVertex, WorkflowEdge, WorkflowExecution)
 """
 import asyncio
+import graphlib
+import hashlib
 import json
 import logging
+import sys
+import threading
 import uuid
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from pydantic import Field, ValidationError
 
@@ -138,6 +154,8 @@ class WorkflowSearchCriteria:
     tags: List[str] = field(default_factory=list)
     is_template: Optional[bool] = None
     is_active: Optional[bool] = None
+    status: Optional[str] = None
+    execution_mode: Optional[str] = None
     created_after: Optional[datetime] = None
     created_before: Optional[datetime] = None
     limit: int = 50
@@ -194,6 +212,16 @@ class WorkflowRepository(ABC):
         """Search workflows by criteria."""
         pass
 
+    async def count_workflows(self, criteria: WorkflowSearchCriteria) -> int:
+        """
+        Count workflows matching criteria, ignoring limit and offset.
+
+        Default implementation falls back to an unpaginated search; concrete
+        repositories should override this with a COUNT query.
+        """
+        unpaginated = replace(criteria, limit=sys.maxsize, offset=0)
+        return len(await self.search_workflows(unpaginated))
+
     @abstractmethod
     async def get_workflow_versions(self, workflow_id: str) -> List["WorkflowVersion"]:
         """Get workflow versions."""
@@ -226,6 +254,11 @@ class WorkflowRepository(ABC):
         pass
 
 
+def _enum_value(value: Any) -> Any:
+    """Compare stored enum members and plain strings by their value."""
+    return getattr(value, "value", value)
+
+
 class MockWorkflowRepository(WorkflowRepository):
     """Mock repository implementation for development/testing."""
 
@@ -242,10 +275,13 @@ class MockWorkflowRepository(WorkflowRepository):
         workflow_data["updated_at"] = datetime.utcnow()
         workflow_data["version"] = 1
 
-        self.workflows[workflow_id] = workflow_data.copy()
+        # One stored snapshot backs both the current record and version 1;
+        # updates replace the current record rather than mutating it
+        snapshot = workflow_data.copy()
+        self.workflows[workflow_id] = snapshot
 
         # Initialize versions
-        self.versions[workflow_id] = [workflow_data.copy()]
+        self.versions[workflow_id] = [snapshot]
 
         # Return mock workflow object
         class MockWorkflow:
@@ -311,50 +347,72 @@ class MockWorkflowRepository(WorkflowRepository):
             return True
         return False
 
+    @staticmethod
+    def _matches(
+        workflow_data: Dict[str, Any], criteria: WorkflowSearchCriteria
+    ) -> bool:
+        """Check a stored workflow against search filters."""
+        if criteria.name_pattern and criteria.name_pattern not in workflow_data.get(
+            "name", ""
+        ):
+            return False
+        if (
+            criteria.project_id
+            and workflow_data.get("project_id") != criteria.project_id
+        ):
+            return False
+        if criteria.user_id and workflow_data.get("user_id") != criteria.user_id:
+            return False
+        if (
+            criteria.is_template is not None
+            and workflow_data.get("is_template") != criteria.is_template
+        ):
+            return False
+        if (
+            criteria.is_active is not None
+            and workflow_data.get("is_active") != criteria.is_active
+        ):
+            return False
+        if criteria.status is not None and (
+            _enum_value(workflow_data.get("status")) != criteria.status
+        ):
+            return False
+        if criteria.execution_mode is not None and (
+            _enum_value(workflow_data.get("execution_mode")) != criteria.execution_mode
+        ):
+            return False
+        if criteria.tags:
+            workflow_tags = set(workflow_data.get("tags", []))
+            if not set(criteria.tags).issubset(workflow_tags):
+                return False
+        return True
+
     async def search_workflows(
         self, criteria: WorkflowSearchCriteria
     ) -> List["Workflow"]:
         """Search workflows by criteria."""
-        results = []
-
-        for workflow_id, workflow_data in self.workflows.items():
-            # Apply filters
-            if (
-                criteria.name_pattern
-                and criteria.name_pattern not in workflow_data.get("name", "")
-            ):
-                continue
-            if (
-                criteria.project_id
-                and workflow_data.get("project_id") != criteria.project_id
-            ):
-                continue
-            if criteria.user_id and workflow_data.get("user_id") != criteria.user_id:
-                continue
-            if (
-                criteria.is_template is not None
-                and workflow_data.get("is_template") != criteria.is_template
-            ):
-                continue
-            if (
-                criteria.is_active is not None
-                and workflow_data.get("is_active") != criteria.is_active
-            ):
-                continue
-            if criteria.tags:
-                workflow_tags = set(workflow_data.get("tags", []))
-                if not set(criteria.tags).issubset(workflow_tags):
-                    continue
-
-            class MockWorkflow:
-                def __init__(self, data):
-                    for key, value in data.items():
-                        setattr(self, key, value)
-
-            results.append(MockWorkflow(workflow_data))
-
-        # Apply pagination
-        return results[criteria.offset : criteria.offset + criteria.limit]
+
+        class MockWorkflow:
+            def __init__(self, data):
+                for key, value in data.items():
+                    setattr(self, key, value)
+
+        # Apply filters and pagination without materializing skipped rows
+        matching = (
+            workflow_data
+            for workflow_data in self.workflows.values()
+            if self._matches(workflow_data, criteria)
+        )
+        page = islice(matching, criteria.offset, criteria.offset + criteria.limit)
+        return [MockWorkflow(workflow_data) for workflow_data in page]
+
+    async def count_workflows(self, criteria: WorkflowSearchCriteria) -> int:
+        """Count workflows matching criteria."""
+        return sum(
+            1
+            for workflow_data in self.workflows.values()
+            if self._matches(workflow_data, criteria)
+        )
 
     async def get_workflow_versions(self, workflow_id: str) -> List["WorkflowVersion"]:
         """Get workflow versions."""
@@ -462,6 +520,64 @@ class MockWorkflowRepository(WorkflowRepository):
         }
 
 
+# Graphs larger than this are validated in a worker thread
+OFFTHREAD_GRAPH_SIZE = 200
+
+# Cycle-check results keyed by graph fingerprint (LRU). Module level because
+# routers build a WorkflowService per request; locked because large graphs
+# are checked from worker threads.
+CYCLE_CACHE_SIZE = 1024
+_cycle_cache: "OrderedDict[str, bool]" = OrderedDict()
+_cycle_cache_lock = threading.Lock()
+
+
+def _graph_field(item: Any, name: str) -> Any:
+    """Read a vertex or edge field from a model or a stored plain dict."""
+    if isinstance(item, Mapping):
+        return item.get(name)
+    return getattr(item, name)
+
+
+def _vertex_refs(vertex: Any) -> Tuple[str, List[str]]:
+    """Return a vertex's ID and the IDs it depends on."""
+    return _graph_field(vertex, "id"), list(_graph_field(vertex, "dependencies") or [])
+
+
+def _edge_endpoints(edge: Any) -> Tuple[str, str]:
+    """Return an edge's source and target vertex IDs."""
+    return _graph_field(edge, "from_vertex_id"), _graph_field(edge, "to_vertex_id")
+
+
+def _graph_fingerprint(
+    vertices: Sequence[Tuple[str, List[str]]], edges: Sequence[Tuple[str, str]]
+) -> str:
+    """Stable digest of a graph given as vertex refs and edge endpoints."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(
+        repr(
+            sorted((vertex_id, tuple(sorted(deps))) for vertex_id, deps in vertices)
+        ).encode()
+    )
+    digest.update(repr(sorted(edges)).encode())
+    return digest.hexdigest()
+
+
+def _detect_cycles(
+    vertices: Sequence[Tuple[str, List[str]]], edges: Sequence[Tuple[str, str]]
+) -> bool:
+    """Check vertex refs and edge endpoints for cycles in one topological sort."""
+    sorter: "graphlib.TopologicalSorter[str]" = graphlib.TopologicalSorter()
+    for vertex_id, deps in vertices:
+        sorter.add(vertex_id, *deps)
+    for from_vertex_id, to_vertex_id in edges:
+        sorter.add(to_vertex_id, from_vertex_id)
+    try:
+        sorter.prepare()
+    except graphlib.CycleError:
+        return True
+    return False
+
+
 class WorkflowService:
     """
     Service layer for workflow management and execution orchestration.
@@ -642,6 +758,87 @@ class WorkflowService:
             logger.error(f"Workflow search failed: {str(e)}")
             raise
 
+    async def count_workflows(self, criteria: WorkflowSearchCriteria) -> int:
+        """Count workflows matching criteria, ignoring limit and offset."""
+        try:
+            return await self.repository.count_workflows(criteria)
+        except Exception as e:
+            logger.error(f"Workflow count failed: {str(e)}")
+            raise
+
+    async def validate_dag(self, vertices: Sequence[Any], edges: Sequence[Any]) -> None:
+        """
+        Validate vertex dependencies, edge endpoints and acyclicity.
+
+        Vertices and edges may be models or the plain dicts a stored workflow
+        holds, so an update that replaces only the vertices can be checked
+        against the existing edges.
+
+        Raises:
+            WorkflowValidationError: If a reference is dangling or the graph
+                contains a cycle.
+        """
+        vertex_refs = [_vertex_refs(vertex) for vertex in vertices]
+        edge_endpoints = [_edge_endpoints(edge) for edge in edges]
+        vertex_ids = {vertex_id for vertex_id, _ in vertex_refs}
+
+        for _, deps in vertex_refs:
+            for dep_id in deps:
+                if dep_id not in vertex_ids:
+                    raise WorkflowValidationError(
+                        f"Dependency '{dep_id}' not found in vertices"
+                    )
+        for from_vertex_id, to_vertex_id in edge_endpoints:
+            if from_vertex_id not in vertex_ids:
+                raise WorkflowValidationError(
+                    f"Edge source vertex '{from_vertex_id}' not found"
+                )
+            if to_vertex_id not in vertex_ids:
+                raise WorkflowValidationError(
+                    f"Edge target vertex '{to_vertex_id}' not found"
+                )
+
+        if await self.has_cycles(vertices, edges):
+            raise WorkflowValidationError(
+                "Workflow contains cycles - DAG structure required"
+            )
+
+    async def has_cycles(self, vertices: Sequence[Any], edges: Sequence[Any]) -> bool:
+        """
+        Check whether a workflow graph contains cycles.
+
+        Graphs with more than ``OFFTHREAD_GRAPH_SIZE`` vertices are checked in
+        a worker thread so the event loop keeps serving other requests.
+        """
+        if len(vertices) > OFFTHREAD_GRAPH_SIZE:
+            return await asyncio.to_thread(self.has_cycles_sync, vertices, edges)
+        return self.has_cycles_sync(vertices, edges)
+
+    def has_cycles_sync(self, vertices: Sequence[Any], edges: Sequence[Any]) -> bool:
+        """
+        Synchronous cycle check backing ``has_cycles``.
+
+        Vertices need ``id`` and ``dependencies``; edges need ``from_vertex_id``
+        and ``to_vertex_id``, as attributes or dict keys. Results are cached by
+        graph fingerprint, so resubmitting an identical graph skips the
+        traversal.
+        """
+        vertex_refs = [_vertex_refs(vertex) for vertex in vertices]
+        edge_endpoints = [_edge_endpoints(edge) for edge in edges]
+        fingerprint = _graph_fingerprint(vertex_refs, edge_endpoints)
+        with _cycle_cache_lock:
+            cached = _cycle_cache.get(fingerprint)
+            if cached is not None:
+                _cycle_cache.move_to_end(fingerprint)
+                return cached
+
+        result = _detect_cycles(vertex_refs, edge_endpoints)
+        with _cycle_cache_lock:
+            _cycle_cache[fingerprint] = result
+            if len(_cycle_cache) > CYCLE_CACHE_SIZE:
+                _cycle_cache.popitem(last=False)
+        return result
+
     # === Execution Operations ===
 
     async def execute_workflow(
@@ -145,6 +145,7 @@ class EngineError(Exception):
         details: Optional[Dict[str, Any]] = None,
         component: Optional[str] = None,
         recoverable: bool = False,
+        status_code: int = 400,
     ):
         super().__init__(message)
         self.message = message
@@ -152,7 +153,10 @@ class EngineError(Exception):
         self.details = details or {}
         self.component = component or "unknown"
         self.recoverable = recoverable
+        self.status_code = status_code
         self.timestamp = datetime.utcnow()
+        # Precomputed so API handlers can use it without re-formatting
+        self.detail = f"[{self.error_code}] {message}"
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert error to dictionary for serialization."""
@@ -166,7 +170,7 @@ class EngineError(Exception):
         }
 
     def __str__(self) -> str:
-        return f"[{self.error_code}] {self.message}"
+        return self.detail
 
 
 # Common Data Types
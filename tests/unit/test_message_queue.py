@@ -0,0 +1,215 @@
+"""
+Tests for the per-connection WebSocket MessageQueue.
+
+Covers latest-value coalescing of progress events, dropping LOW priority
+messages under backpressure, and priority-based eviction when full.
+"""
+
+import pytest
+
+from engine_core.api.websocket import (
+    EventType,
+    MessagePriority,
+    MessageQueue,
+    SubscriptionScope,
+    WebSocketMessage,
+)
+
+
+def _message(
+    event_type,
+    scope_id=None,
+    priority=MessagePriority.NORMAL,
+    scope=SubscriptionScope.AGENT,
+    **data,
+):
+    return WebSocketMessage(
+        event_type=event_type,
+        scope=scope,
+        scope_id=scope_id,
+        priority=priority,
+        data=data,
+    )
+
+
+class TestMessageQueueCoalescing:
+    """Only the newest queued progress value per entity is kept."""
+
+    def test_progress_events_coalesce_in_place(self):
+        """A newer progress event overwrites the queued one, keeping its slot."""
+        queue = MessageQueue()
+        queue.put_message("c1", _message(EventType.AGENT_CREATED, "a1"))
+        queue.put_message(
+            "c1", _message(EventType.AGENT_EXECUTION_PROGRESS, "a1", step=1)
+        )
+        queue.put_message("c1", _message(EventType.AGENT_UPDATED, "a1"))
+        queue.put_message(
+            "c1", _message(EventType.AGENT_EXECUTION_PROGRESS, "a1", step=2)
+        )
+
+        messages = queue.drain_nowait("c1", limit=10)
+
+        assert [m.event_type for m in messages] == [
+            EventType.AGENT_CREATED,
+            EventType.AGENT_EXECUTION_PROGRESS,
+            EventType.AGENT_UPDATED,
+        ]
+        assert messages[1].data == {"step": 2}
+        assert queue.latest_by_key["c1"] == {}
+
+    def test_progress_events_for_other_scope_ids_are_kept(self):
+        """Progress for different scope ids never replaces each other."""
+        queue = MessageQueue()
+        queue.put_message("c1", _message(EventType.AGENT_EXECUTION_PROGRESS, "a1"))
+        queue.put_message("c1", _message(EventType.AGENT_EXECUTION_PROGRESS, "a2"))
+
+        assert queue.get_queue_size("c1") == 2
+
+    def test_same_scope_id_in_other_scopes_is_kept(self):
+        """An agent and a project sharing an id are coalesced separately."""
+        queue = MessageQueue()
+        queue.put_message("c1", _message(EventType.AGENT_EXECUTION_PROGRESS, "x"))
+        queue.put_message(
+            "c1",
+            _message(
+                EventType.AGENT_EXECUTION_PROGRESS,
+                "x",
+                scope=SubscriptionScope.PROJECT,
+            ),
+        )
+
+        assert queue.get_queue_size("c1") == 2
+
+    def test_unscoped_progress_is_keyed_by_entity(self):
+        """Without a scope id, progress of different agents is kept apart."""
+        queue = MessageQueue()
+        for agent_id, step in (("A", 1), ("B", 1), ("A", 2)):
+            queue.put_message(
+                "c1",
+                _message(
+                    EventType.AGENT_EXECUTION_PROGRESS,
+                    scope=SubscriptionScope.GLOBAL,
+                    agent_id=agent_id,
+                    step=step,
+                ),
+            )
+
+        messages = queue.drain_nowait("c1", limit=10)
+
+        assert [(m.data["agent_id"], m.data["step"]) for m in messages] == [
+            ("A", 2),
+            ("B", 1),
+        ]
+
+    def test_unidentified_progress_is_not_coalesced(self):
+        """Progress with neither a scope id nor an entity id is never merged."""
+        queue = MessageQueue()
+        for _ in range(2):
+            queue.put_message(
+                "c1",
+                _message(
+                    EventType.TEAM_EXECUTION_PROGRESS, scope=SubscriptionScope.GLOBAL
+                ),
+            )
+
+        assert queue.get_queue_size("c1") == 2
+
+    def test_progress_event_after_dequeue_is_queued_again(self):
+        """Once the queued slot is sent, the next event gets a new slot."""
+        queue = MessageQueue()
+        first = _message(EventType.WORKFLOW_EXECUTION_PROGRESS, "w1")
+        second = _message(EventType.WORKFLOW_EXECUTION_PROGRESS, "w1")
+        queue.put_message("c1", first)
+
+        assert queue.drain_nowait("c1", limit=10) == [first]
+
+        queue.put_message("c1", second)
+        assert queue.drain_nowait("c1", limit=10) == [second]
+
+    def test_other_events_are_never_coalesced(self):
+        """Past the backpressure threshold ordinary events still all queue up."""
+        queue = MessageQueue(backpressure_threshold=1)
+        for n in range(3):
+            queue.put_message("c1", _message(EventType.SYSTEM_LOG_ENTRY, n=n))
+
+        messages = queue.drain_nowait("c1", limit=10)
+
+        assert [m.data["n"] for m in messages] == [0, 1, 2]
+
+    def test_backpressure_drops_low_priority(self):
+        """A client past the threshold stops receiving LOW priority messages."""
+        queue = MessageQueue(backpressure_threshold=1)
+        queue.put_message("c1", _message(EventType.AGENT_UPDATED, "a1"))
+
+        accepted = queue.put_message(
+            "c1", _message(EventType.AGENT_LOG_ENTRY, "a1", MessagePriority.LOW)
+        )
+
+        assert accepted is False
+        assert queue.get_queue_size("c1") == 1
+
+    @pytest.mark.asyncio
+    async def test_dequeue_returns_coalesced_message(self):
+        """The sender path sees the newest value of a coalesced slot."""
+        queue = MessageQueue()
+        queue.put_message(
+            "c1", _message(EventType.TEAM_EXECUTION_PROGRESS, "t1", step=1)
+        )
+        queue.put_message(
+            "c1", _message(EventType.TEAM_EXECUTION_PROGRESS, "t1", step=2)
+        )
+
+        message = await queue.dequeue_message("c1")
+
+        assert message.data == {"step": 2}
+        assert queue.get_queue_size("c1") == 0
+
+
+class TestMessageQueueEviction:
+    """A full queue drops normal traffic but makes room for urgent messages."""
+
+    def test_full_queue_drops_normal_priority(self):
+        """Normal and low priority messages are rejected when full."""
+        queue = MessageQueue(max_size=2)
+        queue.put_message("c1", _message(EventType.AGENT_CREATED, "a1"))
+        queue.put_message("c1", _message(EventType.AGENT_CREATED, "a2"))
+
+        accepted = queue.put_message("c1", _message(EventType.AGENT_CREATED, "a3"))
+
+        assert accepted is False
+        assert [m.scope_id for m in queue.drain_nowait("c1", limit=10)] == [
+            "a1",
+            "a2",
+        ]
+
+    def test_full_queue_evicts_oldest_for_high_priority(self):
+        """HIGH and CRITICAL messages evict the oldest queued message."""
+        queue = MessageQueue(max_size=2)
+        queue.put_message("c1", _message(EventType.AGENT_CREATED, "a1"))
+        queue.put_message("c1", _message(EventType.AGENT_CREATED, "a2"))
+
+        assert queue.put_message(
+            "c1",
+            _message(EventType.AGENT_DELETED, "a3", priority=MessagePriority.HIGH),
+        )
+        assert queue.put_message(
+            "c1",
+            _message(EventType.AGENT_DELETED, "a4", priority=MessagePriority.CRITICAL),
+        )
+
+        assert [m.scope_id for m in queue.drain_nowait("c1", limit=10)] == [
+            "a3",
+            "a4",
+        ]
+
+    def test_evicted_slot_is_not_coalesced_into(self):
+        """An evicted progress event no longer absorbs newer values."""
+        queue = MessageQueue(max_size=1)
+        queue.put_message("c1", _message(EventType.AGENT_EXECUTION_PROGRESS, "a1"))
+        queue.put_message(
+            "c1",
+            _message(EventType.AGENT_DELETED, "a2", priority=MessagePriority.HIGH),
+        )
+
+        assert queue.latest_by_key["c1"] == {}
+        assert [m.scope_id for m in queue.drain_nowait("c1", limit=10)] == ["a2"]
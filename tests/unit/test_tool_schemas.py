@@ -0,0 +1,91 @@
+"""
+Tests for the tool API schemas.
+
+Type fields are validated as Literal strings but must still accept the
+matching enum members from Python callers. A tool's configuration is
+validated against its type, whether given, null or omitted.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from engine_core.api.schemas.enums import EdgeType, ToolType
+from engine_core.api.schemas.tool_schemas import ToolCreateSchema
+from engine_core.api.schemas.workflow_schemas import WorkflowEdgeSchema
+
+
+def _tool(**overrides):
+    data = {
+        "name": "Search",
+        "tool_type": "mcp",
+        "version": "1.0.0",
+        "description": "Search server",
+        "configuration": {"server_url": "http://localhost:8080"},
+    }
+    data.update(overrides)
+    return ToolCreateSchema(**data)
+
+
+class TestTypeNameAliases:
+    """Literal type aliases accept enum members as well as strings."""
+
+    def test_tool_type_accepts_enum_member(self):
+        """An enum member validates to its plain string value."""
+        tool = _tool(tool_type=ToolType.MCP)
+
+        assert tool.tool_type == "mcp"
+        assert tool.configuration.type == "mcp"
+
+    def test_edge_type_accepts_enum_member(self):
+        """Workflow schemas unwrap enum members the same way."""
+        edge = WorkflowEdgeSchema(
+            source_vertex_id="a",
+            target_vertex_id="b",
+            edge_type=EdgeType.CONDITIONAL,
+        )
+
+        assert edge.edge_type == "conditional"
+
+    def test_unknown_type_is_rejected(self):
+        """Values outside the Literal are still rejected."""
+        with pytest.raises(ValidationError, match="tool_type"):
+            _tool(tool_type="ftp")
+
+
+class TestToolCreateConfiguration:
+    """An omitted configuration is validated like an explicit empty one."""
+
+    @pytest.mark.parametrize(
+        ("tool_type", "required"),
+        [("mcp", "server_url"), ("api", "base_url"), ("cli", "executable_path")],
+    )
+    @pytest.mark.parametrize("configuration", [{}, None, "omitted"])
+    def test_missing_required_setting_is_rejected(
+        self, tool_type, required, configuration
+    ):
+        """Omitted, null and empty configurations all need the same keys."""
+        overrides = {"tool_type": tool_type, "configuration": configuration}
+        if configuration == "omitted":
+            del overrides["configuration"]
+        data = {
+            "name": "Tool",
+            "version": "1.0.0",
+            "description": "A tool",
+            **overrides,
+        }
+
+        with pytest.raises(ValidationError, match=required):
+            ToolCreateSchema(**data)
+
+    def test_omitted_configuration_defaults_for_web_tools(self):
+        """Tool types without required settings get an empty configuration."""
+        tool = ToolCreateSchema(
+            name="Browser", tool_type="web", version="1.0.0", description="Web"
+        )
+
+        assert tool.configuration.type == "web"
+
+    def test_configuration_must_match_tool_type(self):
+        """An explicitly tagged configuration of another type is rejected."""
+        with pytest.raises(ValidationError, match="mcp tools cannot use api"):
+            _tool(configuration={"type": "api", "base_url": "http://localhost"})
@@ -0,0 +1,129 @@
+"""
+Tests for creating tools in the pending state and finalizing their status.
+
+A new tool is stored as pending without being contacted; the background
+check registers it, runs its connection check and persists the outcome.
+"""
+
+import pytest
+
+from engine_core.core.tools import (
+    ToolCapability,
+    ToolHealthCheck,
+    ToolInterface,
+    ToolStatus,
+    ToolType,
+)
+from engine_core.services.tool_service import (
+    MockToolRepository,
+    ToolCreateRequest,
+    ToolSearchCriteria,
+    ToolService,
+)
+
+
+class StubTool(ToolInterface):
+    """Tool whose connection check reports a fixed status."""
+
+    status = ToolStatus.AVAILABLE
+    initialized = 0
+
+    async def initialize(self):
+        type(self).initialized += 1
+        return self.status == ToolStatus.AVAILABLE
+
+    async def execute_capability(self, capability_name, parameters, context=None):
+        raise NotImplementedError
+
+    async def health_check(self):
+        return ToolHealthCheck(tool_id=self.tool_id, status=self.status)
+
+    async def get_capabilities(self) -> list[ToolCapability]:
+        return []
+
+    async def cleanup(self):
+        return True
+
+
+@pytest.fixture
+def service():
+    service = ToolService(MockToolRepository())
+    StubTool.status = ToolStatus.AVAILABLE
+    StubTool.initialized = 0
+    service.tool_registry.tool_factories[ToolType.API] = StubTool
+    return service
+
+
+def _request(tool_id="weather"):
+    return ToolCreateRequest(
+        tool_id=tool_id,
+        name="Weather API",
+        tool_type=ToolType.API,
+        endpoint="https://weather.example.com",
+    )
+
+
+class TestPendingToolCreation:
+    """create_pending_tool followed by test_and_finalize_status."""
+
+    @pytest.mark.asyncio
+    async def test_pending_tool_is_not_contacted(self, service):
+        """Creating a tool stores it as pending without initializing it."""
+        tool = await service.create_pending_tool(_request())
+
+        assert tool.status == ToolStatus.PENDING.value
+        assert service.repository.tools["weather"]["status"] == "pending"
+        assert StubTool.initialized == 0
+        assert service.tool_registry.get_tool("weather") is None
+
+    @pytest.mark.asyncio
+    async def test_healthy_tool_becomes_available(self, service):
+        """A tool passing its connection check is registered and available."""
+        await service.create_pending_tool(_request())
+
+        status = await service.test_and_finalize_status("weather")
+
+        assert status == ToolStatus.AVAILABLE
+        assert service.repository.tools["weather"]["status"] == "available"
+        assert service.tool_registry.get_tool("weather") is not None
+        assert StubTool.initialized == 1
+
+    @pytest.mark.asyncio
+    async def test_unreachable_tool_is_marked_error(self, service):
+        """A tool failing to initialize is persisted with ERROR status."""
+        StubTool.status = ToolStatus.UNAVAILABLE
+        await service.create_pending_tool(_request())
+
+        status = await service.test_and_finalize_status("weather")
+
+        assert status == ToolStatus.ERROR
+        assert service.repository.tools["weather"]["status"] == "error"
+        assert service.tool_registry.get_tool("weather") is None
+
+    @pytest.mark.asyncio
+    async def test_unknown_tool_is_marked_error(self, service):
+        """Finalizing a tool that was never created never raises."""
+        assert await service.test_and_finalize_status("missing") == ToolStatus.ERROR
+
+
+class TestToolCounting:
+    """count_tools reports every match regardless of the requested page."""
+
+    @pytest.mark.asyncio
+    async def test_count_ignores_limit_offset_and_cursor(self, service):
+        """The total is independent of pagination but honours filters."""
+        for index in range(5):
+            await service.repository.create_tool(
+                {"id": f"tool_{index}", "name": "Tool", "project_id": "p1"}
+            )
+        await service.repository.create_tool(
+            {"id": "other", "name": "Other", "project_id": "p2"}
+        )
+
+        criteria = ToolSearchCriteria(
+            project_id="p1", limit=2, offset=1, cursor="tool_0"
+        )
+
+        assert await service.count_tools(criteria) == 5
+        rows = [row.id async for row in service.iter_summaries(criteria)]
+        assert rows == ["tool_2", "tool_3"]
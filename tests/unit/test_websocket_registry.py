@@ -0,0 +1,103 @@
+"""
+Tests for the WebSocket ConnectionRegistry indexes.
+
+Secondary indexes hold bare connection ids; ids whose connection is gone
+must be purged on lookup instead of being returned or kept forever.
+"""
+
+from engine_core.api.websocket import (
+    ConnectionInfo,
+    ConnectionRegistry,
+    EventSubscription,
+    EventType,
+    SubscriptionScope,
+)
+
+
+def _connect(registry, connection_id, user_id="user_1"):
+    connection_info = ConnectionInfo(
+        connection_id=connection_id,
+        websocket=None,
+        user_id=user_id,
+        session_id=f"session_{connection_id}",
+    )
+    registry.add_connection(connection_info)
+    return connection_info
+
+
+class TestConnectionRegistryPurge:
+    """Dangling ids left in the indexes are dropped on lookup."""
+
+    def test_get_subscribers_purges_dangling_ids(self):
+        """Ids without a registered connection are skipped and purged."""
+        registry = ConnectionRegistry()
+        _connect(registry, "live")
+        _connect(registry, "gone")
+        subscription = EventSubscription(
+            scope=SubscriptionScope.PROJECT,
+            scope_id="p1",
+            event_types={EventType.PROJECT_UPDATED},
+        )
+        registry.add_subscription("live", subscription)
+        registry.add_subscription("gone", subscription)
+
+        # Simulate a missed cleanup: the owner is gone, the indexes are not
+        del registry.connections["gone"]
+
+        subscribers = registry.get_subscribers(
+            SubscriptionScope.PROJECT, "p1", EventType.PROJECT_UPDATED
+        )
+
+        assert [c.connection_id for c in subscribers] == ["live"]
+        key = (SubscriptionScope.PROJECT, "p1")
+        assert registry.subscription_index[key] == {"live"}
+        assert "gone" not in registry.event_type_index[EventType.PROJECT_UPDATED]
+        assert "gone" not in registry._connection_event_types
+
+    def test_purge_deletes_emptied_index_entries(self):
+        """Index entries left empty by a purge are removed entirely."""
+        registry = ConnectionRegistry()
+        _connect(registry, "gone")
+        registry.add_subscription(
+            "gone",
+            EventSubscription(scope=SubscriptionScope.GLOBAL, scope_id=None),
+        )
+        del registry.connections["gone"]
+
+        assert registry.has_subscribers(SubscriptionScope.GLOBAL)
+        assert registry.get_subscribers(SubscriptionScope.GLOBAL) == []
+        assert (SubscriptionScope.GLOBAL, None) not in registry.subscription_index
+        assert None not in registry.event_type_index
+        assert not registry.has_subscribers(SubscriptionScope.GLOBAL)
+
+    def test_get_user_connections_purges_dangling_ids(self):
+        """User lookups drop ids of connections no longer registered."""
+        registry = ConnectionRegistry()
+        _connect(registry, "live")
+        _connect(registry, "gone")
+        del registry.connections["gone"]
+
+        connections = registry.get_user_connections("user_1")
+
+        assert [c.connection_id for c in connections] == ["live"]
+        assert registry.user_connections["user_1"] == {"live"}
+
+    def test_remove_connection_clears_indexes(self):
+        """A normal removal leaves nothing behind to purge."""
+        registry = ConnectionRegistry()
+        connection_info = _connect(registry, "c1")
+        registry.add_subscription(
+            "c1",
+            EventSubscription(
+                scope=SubscriptionScope.AGENT,
+                scope_id="a1",
+                event_types={EventType.AGENT_EXECUTION_PROGRESS},
+            ),
+        )
+
+        assert registry.remove_connection("c1") is connection_info
+        assert connection_info.disconnect_event.is_set()
+        assert not registry.subscription_index
+        assert not registry.event_type_index
+        assert not registry.user_connections
+        assert registry.get_subscribers(SubscriptionScope.AGENT, "a1") == []
@@ -0,0 +1,178 @@
+"""
+Tests for the dependency-counting WorkflowCoordinatorActor.
+
+Each vertex must start as soon as its last dependency completes, receive
+the message its parent addressed to it, and a failure must stop the rest
+of the workflow.
+"""
+
+import asyncio
+
+import pytest
+
+from engine_core.core.workflows.actors import VertexNode, WorkflowCoordinatorActor
+from engine_core.core.workflows.workflow_engine import (
+    VertexComputation,
+    VertexExecutionResult,
+    VertexState,
+    WorkflowExecutionContext,
+    WorkflowMessage,
+    WorkflowState,
+)
+
+
+class RecordingComputation(VertexComputation):
+    """Computation that logs its calls and messages every dependent."""
+
+    def __init__(self, log, dependents=(), fail=False, delay=0.0):
+        self.log = log
+        self.dependents = list(dependents)
+        self.fail = fail
+        self.delay = delay
+        self.cancelled = False
+
+    async def compute(self, vertex_id, input_data, messages, context):
+        self.log.append(("start", vertex_id, input_data))
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.fail:
+            raise RuntimeError(f"{vertex_id} failed")
+        self.log.append(("end", vertex_id))
+        return VertexExecutionResult(
+            vertex_id=vertex_id,
+            status=VertexState.COMPLETED,
+            output_data=f"{vertex_id}-out",
+            messages=[
+                WorkflowMessage(
+                    sender_vertex_id=vertex_id,
+                    receiver_vertex_id=dependent,
+                    content={"from": vertex_id},
+                )
+                for dependent in self.dependents
+            ],
+        )
+
+    def get_dependencies(self):
+        return []
+
+    def validate_config(self, config):
+        return True
+
+
+def _build(edges, log, **overrides):
+    """Build VertexNodes from (parent, child) edges over named vertices."""
+    names = sorted({name for edge in edges for name in edge} | set(overrides))
+    dependencies = {name: set() for name in names}
+    dependents = {name: set() for name in names}
+    for parent, child in edges:
+        dependencies[child].add(parent)
+        dependents[parent].add(child)
+    return {
+        name: VertexNode(
+            vertex_id=name,
+            computation=RecordingComputation(
+                log, dependents[name], **overrides.get(name, {})
+            ),
+            dependencies=dependencies[name],
+            dependents=dependents[name],
+        )
+        for name in names
+    }
+
+
+def _position(log, event, vertex_id):
+    return next(i for i, entry in enumerate(log) if entry[:2] == (event, vertex_id))
+
+
+class TestWorkflowCoordinatorActor:
+    """Scheduling through per-vertex pending dependency counts."""
+
+    @pytest.mark.asyncio
+    async def test_diamond_runs_in_dependency_order(self):
+        """A join vertex starts only after all of its parents complete."""
+        log = []
+        vertices = _build(
+            [("a", "b"), ("a", "c"), ("b", "d"), ("c", "d")],
+            log,
+            b={"delay": 0.02},
+        )
+        coordinator = WorkflowCoordinatorActor("wf", vertices)
+
+        result = await coordinator.execute_workflow(
+            WorkflowExecutionContext(workflow_id="wf"), {"a": {"seed": 1}}
+        )
+
+        assert result["status"] == WorkflowState.COMPLETED.value
+        assert sorted(result["completed_vertices"]) == ["a", "b", "c", "d"]
+        assert result["failed_vertices"] == []
+        assert result["result"] == {"d": "d-out"}
+
+        assert log[0] == ("start", "a", {"seed": 1})
+        assert ("start", "b", {"from": "a"}) in log
+        assert ("start", "c", {"from": "a"}) in log
+        start_d = _position(log, "start", "d")
+        assert start_d > _position(log, "end", "b")
+        assert start_d > _position(log, "end", "c")
+        # c must not wait for the slower b before starting
+        assert _position(log, "start", "c") < _position(log, "end", "b")
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_running_vertices(self):
+        """A failed vertex stops its siblings and never starts dependents."""
+        log = []
+        vertices = _build(
+            [("a", "c"), ("b", "c")],
+            log,
+            a={"fail": True},
+            b={"delay": 10},
+        )
+        coordinator = WorkflowCoordinatorActor("wf", vertices)
+
+        result = await asyncio.wait_for(
+            coordinator.execute_workflow(WorkflowExecutionContext(), {}), timeout=1
+        )
+
+        assert result["status"] == WorkflowState.FAILED.value
+        assert result["failed_vertices"] == ["a"]
+        assert vertices["b"].computation.cancelled
+        assert not any(entry[:2] == ("start", "c") for entry in log)
+        assert all(task.done() for task in coordinator._in_flight)
+
+    @pytest.mark.asyncio
+    async def test_cancel_waits_for_vertices_to_unwind(self):
+        """Cancelling the workflow cancels and awaits in-flight vertices."""
+        log = []
+        vertices = _build([], log, a={"delay": 10}, b={"delay": 10})
+        coordinator = WorkflowCoordinatorActor("wf", vertices)
+
+        task = asyncio.create_task(
+            coordinator.execute_workflow(WorkflowExecutionContext(), {})
+        )
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert vertices["a"].computation.cancelled
+        assert vertices["b"].computation.cancelled
+        assert all(task.done() for task in coordinator._in_flight)
+
+    @pytest.mark.asyncio
+    async def test_empty_workflow_completes_immediately(self):
+        """A workflow without vertices completes with no results."""
+        coordinator = WorkflowCoordinatorActor("wf", {})
+
+        result = await asyncio.wait_for(
+            coordinator.execute_workflow(WorkflowExecutionContext(), {}), timeout=1
+        )
+
+        assert result == {
+            "status": WorkflowState.COMPLETED.value,
+            "result": {},
+            "completed_vertices": [],
+            "failed_vertices": [],
+        }
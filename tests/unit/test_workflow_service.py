@@ -0,0 +1,70 @@
+"""
+Tests for WorkflowService DAG validation.
+
+An update that replaces only the vertices is validated against the edges
+of the stored workflow, which are plain dicts rather than edge models.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from engine_core.services.workflow_service import (
+    MockWorkflowRepository,
+    WorkflowService,
+    WorkflowValidationError,
+)
+
+
+def _vertex(vertex_id, *dependencies):
+    return SimpleNamespace(id=vertex_id, dependencies=list(dependencies))
+
+
+def _stored_edge(from_vertex_id, to_vertex_id):
+    return {
+        "from_vertex_id": from_vertex_id,
+        "to_vertex_id": to_vertex_id,
+        "condition": None,
+        "data_mapping": None,
+    }
+
+
+@pytest.fixture
+def service():
+    return WorkflowService(MockWorkflowRepository())
+
+
+class TestValidateDag:
+    """validate_dag checks references and cycles for models and stored dicts."""
+
+    @pytest.mark.asyncio
+    async def test_new_vertices_with_stored_edges_pass(self, service):
+        """Replacing only the vertices validates against the stored edges."""
+        vertices = [_vertex("a"), _vertex("b", "a"), _vertex("c")]
+        stored_edges = [_stored_edge("a", "b"), _stored_edge("b", "c")]
+
+        await service.validate_dag(vertices, stored_edges)
+
+    @pytest.mark.asyncio
+    async def test_stored_edge_to_removed_vertex_is_rejected(self, service):
+        """A stored edge pointing at a dropped vertex fails validation."""
+        vertices = [_vertex("a")]
+        stored_edges = [_stored_edge("a", "b")]
+
+        with pytest.raises(WorkflowValidationError, match="target vertex 'b'"):
+            await service.validate_dag(vertices, stored_edges)
+
+    @pytest.mark.asyncio
+    async def test_cycle_through_stored_edges_is_rejected(self, service):
+        """New dependencies closing a loop with stored edges form a cycle."""
+        vertices = [_vertex("a", "b"), _vertex("b")]
+        stored_edges = [_stored_edge("a", "b")]
+
+        with pytest.raises(WorkflowValidationError, match="cycles"):
+            await service.validate_dag(vertices, stored_edges)
+
+    @pytest.mark.asyncio
+    async def test_missing_dependency_is_rejected(self, service):
+        """A dependency on an unknown vertex fails before the cycle check."""
+        with pytest.raises(WorkflowValidationError, match="Dependency 'x'"):
+            await service.validate_dag([_vertex("a", "x")], [])